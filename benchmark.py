@@ -0,0 +1,382 @@
+"""Benchmarks for the tournament core paths on synthetic tournaments.
+
+    python benchmark.py
+    python benchmark.py --sizes 20 1000 100000 --games-per-team 5 --replay-rate 0.1 --score-model poisson
+    python benchmark.py --out new.json --compare old.json
+    python benchmark.py --check
+
+Each case is timed from 20 up to 100k teams. Once a case exceeds --budget seconds
+at one size it is skipped for the larger sizes. Results are written as JSON so
+runs from different versions can be compared with --compare. --check instead
+compares clinch_analysis() against brute force on small random tournaments.
+"""
+import argparse
+import itertools
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+
+import tournament_seeding as ts
+
+DEFAULT_SIZES = [20, 100, 1000, 10000, 100000]
+
+# ------------------ Generators ------------------ #
+def make_teams(n_teams):
+    return [ts.Team(f"Team {i}") for i in range(1, n_teams + 1)]
+
+def assign_pools(teams, n_pools, rng):
+    shuffled = teams[:]
+    rng.shuffle(shuffled)
+    for i, team in enumerate(shuffled):
+        team.pool_id = i % n_pools + 1
+
+def make_score_model(name, teams, rng):
+    if name == "poisson":
+        return ts.PoissonScoreModel({t.id: rng.uniform(0.6, 1.6) for t in teams})
+    if name == "rating":
+        return ts.RatingScoreModel({t.id: rng.gauss(1500, 200) for t in teams})
+    return ts.UniformScoreModel()
+
+SCORE_MODELS = ["uniform", "poisson", "rating"]
+
+def make_games(teams, games_per_team, replay_rate, rng, score_model=None):
+    """Pool-play games where roughly games_per_team games are played by every team.
+
+    With probability replay_rate a game repeats a pairing already played in that
+    pool. All games are scored in one batch by score_model (uniform by default).
+    """
+    pools = ts.PoolIndex(max(t.pool_id for t in teams), teams)
+    pairs = []
+    for pool_id in pools.pool_ids():
+        members = list(pools.members(pool_id))
+        size = len(members)
+        if size < 2:
+            continue
+        played = []
+        for i in range(size * games_per_team // 2):
+            if played and rng.random() < replay_rate:
+                team1, team2 = rng.choice(played)
+            else:
+                offset = i // size % (size - 1) + 1
+                team1 = members[i % size]
+                team2 = members[(i + offset) % size]
+                played.append((team1, team2))
+            pairs.append((team1, team2))
+
+    model = score_model or ts.UniformScoreModel()
+    scores1, scores2 = model.sample([t1.id for t1, _ in pairs], [t2.id for _, t2 in pairs], ts.ScoreStream(rng.getrandbits(32)))
+    return [{"team1": t1.name, "score1": s1, "team2": t2.name, "score2": s2}
+            for (t1, t2), s1, s2 in zip(pairs, scores1, scores2)]
+
+def make_tournament(n_teams, n_pools=None, games_per_team=3, replay_rate=0.0, score_model="uniform", seed=0):
+    """Return a tournament in the same shape as a saved tournament file."""
+    rng = random.Random(seed)
+    if n_pools is None:
+        n_pools = max(1, n_teams // 4)
+    teams = make_teams(n_teams)
+    assign_pools(teams, n_pools, rng)
+    games = make_games(teams, games_per_team, replay_rate, rng, make_score_model(score_model, teams, rng))
+    return {
+        "teams": [t.to_dict() for t in teams],
+        "games": games,
+        "pool_count": n_pools,
+        "pool_size": -(-n_teams // n_pools),
+    }
+
+# ------------------ Cases ------------------ #
+class Fixture:
+    def __init__(self, data, games_per_team, replay_rate, score_model, workdir):
+        self.data = data
+        self.games_per_team = games_per_team
+        self.replay_rate = replay_rate
+        self.score_model_name = score_model
+        self.store = None
+        self.path = os.path.join(workdir, f"bench_{len(data['teams'])}.json")
+        with open(self.path, "w") as f:
+            json.dump(data, f)
+        self.reload()
+
+    def reload(self):
+        self.teams, self.games, self.pool_count, self.pool_size = ts.read_tournament(self.path)
+        self.pools = ts.PoolIndex(self.pool_count, self.teams)
+        ts.replay_stats(self.teams, self.games)
+        self.score_model = make_score_model(self.score_model_name, self.teams, random.Random(0))
+        # The same tournament with every other game still to be played
+        self.unplayed = self.games.copy()
+        for i in range(1, len(self.unplayed), 2):
+            t1, _, t2, _ = self.unplayed[i]
+            self.unplayed[i] = (t1, 0, t2, 0)
+        self.unplayed_teams = [t.copy() for t in self.teams]
+        ts.replay_stats(self.unplayed_teams, self.unplayed)
+        if self.store:
+            self.store.save(self.teams, self.games, self.pool_count, self.pool_size)
+
+    def open_store(self):
+        if self.store is None:
+            self.store = ts.SQLiteStore(os.path.splitext(self.path)[0] + ".db")
+            self.store.open("bench")
+            self.store.save(self.teams, self.games, self.pool_count, self.pool_size)
+
+    def close(self):
+        if self.store:
+            self.store.close()
+
+def case_save(fx):
+    ts.write_tournament(fx.path, fx.teams, fx.games, fx.pool_count, fx.pool_size)
+
+def case_load(fx):
+    ts.read_tournament(fx.path)
+
+def case_save_db(fx):
+    fx.store.save(fx.teams, fx.games, fx.pool_count, fx.pool_size)
+
+def case_load_db(fx):
+    ts.load_tournament(fx.path, store=fx.store)
+
+def case_edit_db(fx):
+    """100 single-game row writes, as made when editing scores one at a time."""
+    for i in range(min(100, len(fx.games))):
+        fx.store.save_game(i, fx.games[i])
+
+def case_replay(fx):
+    ts.replay_stats(fx.teams, fx.games)
+
+def case_schedule(fx):
+    ts.generate_schedule(fx.teams, fx.pools, fx.games_per_team, fx.replay_rate > 0, fx.score_model, seed=0)
+
+def case_simulate(fx):
+    ts.simulate_games(fx.games.team1, fx.games.team2, fx.score_model, seed=0)
+
+def case_seeding(fx):
+    ts.seed_teams(fx.teams, fx.games)
+
+def case_swiss(fx):
+    ts.swiss_pairings(fx.teams, fx.games)
+
+def case_clinch(fx):
+    ts.clinch_analysis(fx.unplayed_teams, fx.unplayed)
+
+def case_tiebreaks(fx):
+    by_wins = sorted(fx.teams, key=lambda t: t.wins, reverse=True)
+    for t1, t2 in zip(by_wins, by_wins[1:]):
+        if t1.wins == t2.wins:
+            ts.h2h_winner(t1, t2, fx.games)
+
+CASES = {
+    "save": case_save,
+    "load": case_load,
+    "save_db": case_save_db,
+    "load_db": case_load_db,
+    "edit_db": case_edit_db,
+    "replay": case_replay,
+    "schedule": case_schedule,
+    "simulate": case_simulate,
+    "seeding": case_seeding,
+    "swiss": case_swiss,
+    "clinch": case_clinch,
+    "tiebreaks": case_tiebreaks,
+}
+
+# ------------------ GUI Cases ------------------ #
+class HeadlessGUI(ts.TournamentGUI):
+    """TournamentGUI without the blocking startup prompt or autosave."""
+    def startup_prompt(self):
+        pass
+
+    def autosave(self, team=None, game_index=None):
+        pass
+
+def make_gui():
+    """Return a withdrawn HeadlessGUI, or None when no display is available."""
+    try:
+        root = ts.tk.Tk()
+    except ts.tk.TclError:
+        return None
+    root.withdraw()
+    return HeadlessGUI(root)
+
+def case_refresh(fx, app):
+    """Refresh every tab, showing each one in turn so none is deferred."""
+    app.update_all_views()
+    for tab in app.tab_views:
+        app.show_tab(tab)
+    app.root.update_idletasks()
+
+def case_startup(fx, app):
+    """Cold start: a new window loading fx's file, timed until it is idle and interactive."""
+    cold = make_gui()
+    cold._load_from_file(fx.path)
+    cold.root.update()
+    cold.root.destroy()
+
+GUI_CASES = {
+    "refresh": case_refresh,
+    "startup": case_startup,
+}
+
+def prepare_gui(fx, app):
+    app.pool_count, app.pool_size = fx.pool_count, fx.pool_size
+    app.set_teams(fx.teams)
+    app.games = fx.games
+    app.rebuild_pool_frames()
+
+# ------------------ Self-checks ------------------ #
+def brute_force_seeds(teams, games):
+    """Best and worst seed of every team over every outcome of the unplayed games.
+
+    Each unplayed game is tried as a win either way and as a draw, and the
+    seeds each outcome allows are read off the seed_teams() rules.
+    """
+    unplayed = [i for i, (t1, s1, t2, s2) in enumerate(games) if ts.is_unplayed(s1, s2)]
+    result = {t.id: (len(teams), 1) for t in teams}
+    for outcome in itertools.product(((1, 0), (0, 1), (1, 1)), repeat=len(unplayed)):
+        filled = games.copy()
+        for i, (s1, s2) in zip(unplayed, outcome):
+            t1, _, t2, _ = filled[i]
+            filled[i] = (t1, s1, t2, s2)
+        final = [t.copy() for t in teams]
+        ts.replay_stats(final, filled)
+        for team in final:
+            group = [t for t in final if t.wins == team.wins]
+            seed = 1 + sum(1 for t in final if t.wins > team.wins)
+            if len(group) == 2 and ts.h2h_winner(group[0], group[1], filled):
+                seed += ts.h2h_winner(group[0], group[1], filled) is not team
+                lowest = highest = seed
+            else:
+                lowest, highest = seed, seed + len(group) - 1
+            best, worst = result[team.id]
+            result[team.id] = (min(best, lowest), max(worst, highest))
+    return result
+
+def check_clinch(trials=300, seed=0):
+    """Compare clinch_analysis() with brute force on small random tournaments. Returns the mismatches."""
+    rng = random.Random(seed)
+    mismatches = []
+    for _ in range(trials):
+        teams = make_teams(rng.randint(2, 6))
+        rows = []
+        for _ in range(rng.randint(0, 8)):
+            team1, team2 = rng.sample(teams, 2)
+            rows.append((team1.id, rng.randint(0, 3), team2.id, rng.randint(0, 3)))
+        for _ in range(rng.randint(0, 6)):
+            team1, team2 = rng.sample(teams, 2)
+            rows.append((team1.id, 0, team2.id, 0))
+        rng.shuffle(rows)
+        games = ts.GameTable(rows)
+        ts.replay_stats(teams, games)
+        got = ts.clinch_analysis(teams, games)
+        expected = brute_force_seeds(teams, games)
+        if got != expected:
+            mismatches.append((rows, got, expected))
+    return mismatches
+
+# ------------------ Runner ------------------ #
+def time_case(func, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def run(sizes, cases, games_per_team, replay_rate, score_model, repeat, budget, seed, gui=True):
+    results = []
+    over_budget = set()
+    wants_gui = gui and any(name in GUI_CASES for name in cases)
+    app = make_gui() if wants_gui else None
+    if wants_gui and app is None:
+        print(f"{', '.join(name for name in cases if name in GUI_CASES)}: skipped, no display available")
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for n_teams in sizes:
+            data = make_tournament(n_teams, games_per_team=games_per_team, replay_rate=replay_rate,
+                                   score_model=score_model, seed=seed)
+            fx = Fixture(data, games_per_team, replay_rate, score_model, workdir)
+            for name in cases:
+                if name in GUI_CASES:
+                    if app is None:
+                        continue
+                    prepare_gui(fx, app)
+                    func = lambda: GUI_CASES[name](fx, app)
+                else:
+                    func = lambda: CASES[name](fx)
+                if name.endswith("_db"):
+                    fx.open_store()
+                if name in over_budget:
+                    seconds = None
+                else:
+                    seconds = time_case(func, repeat)
+                    if seconds > budget:
+                        over_budget.add(name)
+                    fx.reload()
+                results.append({"case": name, "teams": n_teams, "games": len(fx.games), "seconds": seconds})
+                shown = "skipped" if seconds is None else f"{seconds * 1000:10.2f} ms"
+                print(f"{name:<10} {n_teams:>7} teams {len(fx.games):>8} games  {shown}")
+            fx.close()
+
+    if app is not None:
+        app.root.destroy()
+    return results
+
+def compare(results, baseline_path):
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    old = {(r["case"], r["teams"]): r["seconds"] for r in baseline["results"]}
+    print(f"\nCompared with {baseline_path} (version {baseline.get('version')}):")
+    for r in results:
+        before = old.get((r["case"], r["teams"]))
+        if before is None or r["seconds"] is None:
+            continue
+        ratio = r["seconds"] / before if before else float("inf")
+        print(f"{r['case']:<10} {r['teams']:>7} teams  {before * 1000:10.2f} ms -> {r['seconds'] * 1000:10.2f} ms  x{ratio:.2f}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark tournament core paths on synthetic data.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="team counts to benchmark")
+    parser.add_argument("--cases", nargs="+", default=list(CASES) + list(GUI_CASES), choices=list(CASES) + list(GUI_CASES))
+    parser.add_argument("--games-per-team", type=int, default=3)
+    parser.add_argument("--replay-rate", type=float, default=0.0, help="fraction of games that repeat a pairing")
+    parser.add_argument("--score-model", default="uniform", choices=SCORE_MODELS)
+    parser.add_argument("--repeat", type=int, default=3, help="best of this many runs per case")
+    parser.add_argument("--budget", type=float, default=10.0, help="skip larger sizes once a case takes this many seconds")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-gui", action="store_true", help="skip cases that need a display")
+    parser.add_argument("--out", default="bench_results.json", help="file to record results in")
+    parser.add_argument("--compare", metavar="FILE", help="earlier results file to compare against")
+    parser.add_argument("--check", action="store_true", help="check clinch analysis against brute force instead of timing")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        mismatches = check_clinch(seed=args.seed)
+        for rows, got, expected in mismatches[:5]:
+            print(f"games {rows}\n  clinch_analysis {got}\n  brute force     {expected}")
+        print(f"clinch: {len(mismatches)} mismatches")
+        return 1 if mismatches else 0
+
+    results = run(args.sizes, args.cases, args.games_per_team, args.replay_rate, args.score_model,
+                  args.repeat, args.budget, args.seed, gui=not args.no_gui)
+    record = {
+        "version": ts.VERSION,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "games_per_team": args.games_per_team,
+        "replay_rate": args.replay_rate,
+        "score_model": args.score_model,
+        "numpy": ts.np is not None,
+        "results": results,
+    }
+    with open(args.out, "w") as f:
+        json.dump(record, f, indent=4)
+    print(f"\nResults written to {args.out}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+if __name__ == "__main__":
+    sys.exit(main())
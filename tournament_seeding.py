@@ -2,19 +2,61 @@ import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog, filedialog
 import random
 import json
+import os
+import sqlite3
 import colorsys
+import math
+import itertools
+import heapq
+import bisect
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:  # score models fall back to the random module
+    np = None
+from array import array
+
+VERSION = "1.3"
 
 # ------------------ Team Class ------------------ #
+def parse_pool_id(pool_name):
+    """Return the pool number from a "Pool N" name, or 0 for unassigned or malformed names."""
+    if pool_name and "Pool" in pool_name:
+        try:
+            return int(pool_name.split()[1])
+        except (ValueError, IndexError):
+            pass
+    return 0
+
 class Team:
+    __slots__ = ("id", "name", "wins", "losses", "runs_for", "runs_against", "run_differential", "pool_id", "games_played", "byes")
+    _ids = itertools.count(1)
+
     def __init__(self, name):
+        self.id = next(Team._ids)
         self.name = name
         self.wins = 0
         self.losses = 0
         self.runs_for = 0
         self.runs_against = 0
         self.run_differential = 0
-        self.pool = ""
+        self.pool_id = 0
         self.games_played = 0
+        self.byes = 0
+
+    @property
+    def pool(self):
+        return f"Pool {self.pool_id}" if self.pool_id else ""
+
+    def copy(self):
+        t = Team.__new__(Team)
+        for attr in Team.__slots__:
+            setattr(t, attr, getattr(self, attr))
+        return t
 
     def to_dict(self):
         return {
@@ -25,7 +67,8 @@ class Team:
             "runs_against": self.runs_against,
             "run_differential": self.run_differential,
             "pool": self.pool,
-            "games_played": self.games_played
+            "games_played": self.games_played,
+            "byes": self.byes
         }
 
     @staticmethod
@@ -36,12 +79,1177 @@ class Team:
         t.runs_for = data["runs_for"]
         t.runs_against = data["runs_against"]
         t.run_differential = data["run_differential"]
-        t.pool = data["pool"]
+        t.pool_id = parse_pool_id(data["pool"])
         t.games_played = data.get("games_played", 0)
+        t.byes = data.get("byes", 0)
         return t
 
+# ------------------ Game Table ------------------ #
+class GameTable:
+    """Games stored column-wise as arrays of team IDs and scores.
+
+    Rows are (team1_id, score1, team2_id, score2) tuples. Team names only
+    appear at the file boundary, see to_dicts() and from_dicts(). Saved games
+    naming a team that doesn't exist are kept as dicts in unresolved, so they
+    survive the next save and come back once a team with that name is added.
+    """
+    __slots__ = ("team1", "score1", "team2", "score2", "unresolved")
+
+    def __init__(self, rows=()):
+        self.team1 = array("i")
+        self.score1 = array("i")
+        self.team2 = array("i")
+        self.score2 = array("i")
+        self.unresolved = []
+        for row in rows:
+            self.append(*row)
+
+    def append(self, team1, score1, team2, score2):
+        self.team1.append(team1)
+        self.score1.append(score1)
+        self.team2.append(team2)
+        self.score2.append(score2)
+
+    def clear(self):
+        for column in (self.team1, self.score1, self.team2, self.score2):
+            del column[:]
+        self.unresolved.clear()
+
+    def extend(self, team1, score1, team2, score2):
+        self.team1.extend(team1)
+        self.score1.extend(score1)
+        self.team2.extend(team2)
+        self.score2.extend(score2)
+
+    def copy(self):
+        table = GameTable()
+        table.team1, table.score1 = array("i", self.team1), array("i", self.score1)
+        table.team2, table.score2 = array("i", self.team2), array("i", self.score2)
+        table.unresolved = list(self.unresolved)
+        return table
+
+    def __len__(self):
+        return len(self.team1)
+
+    def __iter__(self):
+        return zip(self.team1, self.score1, self.team2, self.score2)
+
+    def __getitem__(self, idx):
+        return (self.team1[idx], self.score1[idx], self.team2[idx], self.score2[idx])
+
+    def __setitem__(self, idx, row):
+        self.team1[idx], self.score1[idx], self.team2[idx], self.score2[idx] = row
+
+    def __delitem__(self, idx):
+        for column in (self.team1, self.score1, self.team2, self.score2):
+            del column[idx]
+
+    def to_dicts(self, teams_by_id):
+        games = [{"team1": teams_by_id[t1].name, "score1": s1, "team2": teams_by_id[t2].name, "score2": s2}
+                 for t1, s1, t2, s2 in self]
+        games.extend(self.unresolved)
+        return games
+
+    @staticmethod
+    def from_dicts(games, teams):
+        """Build a table from saved game dicts, keeping games with unknown teams in unresolved."""
+        table = GameTable()
+        table.unresolved = list(games)
+        table.resolve(teams)
+        return table
+
+    def resolve(self, teams):
+        """Move unresolved games whose teams now exist into the table. Returns how many moved."""
+        ids = {}
+        for t in teams:
+            ids.setdefault(t.name, t.id)
+        pending, self.unresolved = self.unresolved, []
+        for g in pending:
+            t1 = ids.get(g['team1'])
+            t2 = ids.get(g['team2'])
+            if t1 and t2:
+                self.append(t1, g['score1'], t2, g['score2'])
+            else:
+                self.unresolved.append(g)
+        return len(pending) - len(self.unresolved)
+
+# ------------------ Pool Index ------------------ #
+class PoolIndex:
+    """Pool membership for every team, with the bank stored as pool 0.
+
+    Each pool keeps its teams in insertion order, so moves, counts and bank
+    lookups are O(1). Team.pool_id mirrors the index and is only written here.
+    """
+    def __init__(self, pool_count, teams=()):
+        self._pools = {pool_id: {} for pool_id in range(pool_count + 1)}
+        for team in teams:
+            self.add(team)
+
+    @property
+    def pool_count(self):
+        return len(self._pools) - 1
+
+    def pool_ids(self):
+        return range(1, len(self._pools))
+
+    def add(self, team):
+        """Index a team under its current pool_id. Teams in pools that don't exist go to the bank."""
+        if team.pool_id not in self._pools:
+            team.pool_id = 0
+        self._pools[team.pool_id][team] = None
+
+    def remove(self, team):
+        self._pools[team.pool_id].pop(team, None)
+
+    def move(self, team, pool_id):
+        self._pools[team.pool_id].pop(team, None)
+        self._pools[pool_id][team] = None
+        team.pool_id = pool_id
+
+    def members(self, pool_id):
+        """Teams in a pool in the order they joined it, as a live view."""
+        return self._pools.get(pool_id, {}).keys()
+
+    def bank(self):
+        return self._pools[0].keys()
+
+    def count(self, pool_id):
+        return len(self._pools.get(pool_id, ()))
+
+    def clear(self):
+        bank = self._pools[0]
+        for pool_id in self.pool_ids():
+            for team in self._pools[pool_id]:
+                team.pool_id = 0
+                bank[team] = None
+            self._pools[pool_id] = {}
+
+    def resize(self, pool_count):
+        """Change the number of pools, moving every team to the bank."""
+        self.clear()
+        bank = self._pools[0]
+        self._pools = {pool_id: {} for pool_id in range(pool_count + 1)}
+        self._pools[0] = bank
+
+# ------------------ Score Models ------------------ #
+class ScoreStream:
+    """A source of random numbers for score models, seeded with an int.
+
+    The same seed always gives the same scores. Scores are drawn with numpy
+    when it is installed, and with the random module otherwise, so the two
+    give different (but each reproducible) results.
+    """
+    def __init__(self, seed=None):
+        self.seed = seed
+        self.random = random.Random(seed)
+        self.np = np.random.default_rng(seed) if np is not None else None
+
+def _poisson(rand, lam):
+    if lam > 30:
+        return max(0, round(rand.gauss(lam, math.sqrt(lam))))
+    limit = math.exp(-lam)
+    k, p = 0, rand.random()
+    while p > limit:
+        k += 1
+        p *= rand.random()
+    return k
+
+def _lookup_array(values, ids, default):
+    """numpy array of values[id] for each id, or default for IDs not in values."""
+    table = np.full(max(max(ids), max(values, default=0)) + 1, default, dtype=float)
+    table[list(values)] = list(values.values())
+    return table[np.asarray(ids)]
+
+class ScoreModel(ABC):
+    """Scores a batch of games in one call.
+
+    sample() takes two equal-length sequences of team IDs and a ScoreStream,
+    and returns (scores1, scores2) as lists of ints.
+    """
+    @abstractmethod
+    def sample(self, team1_ids, team2_ids, stream):
+        pass
+
+class UniformScoreModel(ScoreModel):
+    """Every score is equally likely between low and high, inclusive."""
+    def __init__(self, low=0, high=10):
+        self.low = low
+        self.high = high
+
+    def sample(self, team1_ids, team2_ids, stream):
+        n = len(team1_ids)
+        if stream.np is not None:
+            scores = stream.np.integers(self.low, self.high + 1, size=(2, n))
+            return scores[0].tolist(), scores[1].tolist()
+        rand, low, span = stream.random.random, self.low, self.high - self.low + 1
+        return ([low + int(rand() * span) for _ in range(n)],
+                [low + int(rand() * span) for _ in range(n)])
+
+class PoissonScoreModel(ScoreModel):
+    """Poisson scores whose mean is mean * own strength / opponent strength.
+
+    strengths maps team ID to strength. Teams without an entry have strength 1.0.
+    Raises ValueError if a strength is not positive.
+    """
+    def __init__(self, strengths=None, mean=5.0):
+        strengths = strengths or {}
+        for team_id, strength in strengths.items():
+            if not strength > 0:
+                raise ValueError(f"Strength of team {team_id} must be positive, got {strength}")
+        self.strengths = strengths
+        self.mean = mean
+
+    def sample(self, team1_ids, team2_ids, stream):
+        if not len(team1_ids):
+            return [], []
+        if stream.np is not None:
+            s1 = _lookup_array(self.strengths, team1_ids, 1.0)
+            s2 = _lookup_array(self.strengths, team2_ids, 1.0)
+            return (stream.np.poisson(self.mean * s1 / s2).tolist(),
+                    stream.np.poisson(self.mean * s2 / s1).tolist())
+        rand, get, mean = stream.random, self.strengths.get, self.mean
+        scores1, scores2 = [], []
+        for t1, t2 in zip(team1_ids, team2_ids):
+            s1, s2 = get(t1, 1.0), get(t2, 1.0)
+            scores1.append(_poisson(rand, mean * s1 / s2))
+            scores2.append(_poisson(rand, mean * s2 / s1))
+        return scores1, scores2
+
+class RatingScoreModel(ScoreModel):
+    """Elo-style ratings: a Poisson number of total runs split by each team's expected share.
+
+    A team rated `spread` points higher expects ten times the opponent's share
+    of the runs. ratings maps team ID to rating. Unrated teams get 1500.
+    """
+    def __init__(self, ratings=None, mean=5.0, spread=400.0):
+        self.ratings = ratings or {}
+        self.mean = mean
+        self.spread = spread
+
+    def sample(self, team1_ids, team2_ids, stream):
+        if not len(team1_ids):
+            return [], []
+        if stream.np is not None:
+            r1 = _lookup_array(self.ratings, team1_ids, 1500.0)
+            r2 = _lookup_array(self.ratings, team2_ids, 1500.0)
+            shares = 1 / (1 + 10 ** ((r2 - r1) / self.spread))
+            totals = stream.np.poisson(2 * self.mean, size=len(shares))
+            scores1 = stream.np.binomial(totals, shares)
+            return scores1.tolist(), (totals - scores1).tolist()
+        get = self.ratings.get
+        shares = [1 / (1 + 10 ** ((get(t2, 1500) - get(t1, 1500)) / self.spread))
+                  for t1, t2 in zip(team1_ids, team2_ids)]
+        rand = stream.random
+        scores1, scores2 = [], []
+        for share in shares:
+            total = _poisson(rand, 2 * self.mean)
+            runs = sum(1 for _ in range(total) if rand.random() < share)
+            scores1.append(runs)
+            scores2.append(total - runs)
+        return scores1, scores2
+
+def simulate_games(team1_ids, team2_ids, model, seed=None):
+    """Score every pairing with the model in one batch and return them as a GameTable."""
+    scores1, scores2 = model.sample(team1_ids, team2_ids, ScoreStream(seed))
+    games = GameTable()
+    games.extend(team1_ids, scores1, team2_ids, scores2)
+    return games
+
+# ------------------ Tournament Logic ------------------ #
+def reset_stats(teams):
+    for team in teams:
+        team.wins = 0
+        team.losses = 0
+        team.runs_for = 0
+        team.runs_against = 0
+        team.run_differential = 0
+        team.games_played = 0
+
+def update_team_stats(team1, team2, s1, s2, is_new_game=True):
+    if is_new_game:
+        team1.games_played += 1
+        team2.games_played += 1
+
+    team1.runs_for += s1
+    team1.runs_against += s2
+    team2.runs_for += s2
+    team2.runs_against += s1
+
+    if s1 > s2:
+        team1.wins += 1
+        team2.losses += 1
+    elif s2 > s1:
+        team2.wins += 1
+        team1.losses += 1
+
+    team1.run_differential = team1.runs_for - team1.runs_against
+    team2.run_differential = team2.runs_for - team2.runs_against
+
+def remove_game_stats(team1, team2, s1, s2):
+    team1.runs_for -= s1
+    team1.runs_against -= s2
+    team2.runs_for -= s2
+    team2.runs_against -= s1
+
+    team1.games_played -= 1
+    team2.games_played -= 1
+
+    if s1 > s2:
+        team1.wins -= 1
+        team2.losses -= 1
+    elif s2 > s1:
+        team2.wins -= 1
+        team1.losses -= 1
+
+    team1.run_differential = team1.runs_for - team1.runs_against
+    team2.run_differential = team2.runs_for - team2.runs_against
+
+def replay_stats(teams, games, progress=None):
+    reset_stats(teams)
+    teams_by_id = {t.id: t for t in teams}
+    for i, (t1, s1, t2, s2) in enumerate(games):
+        if progress and i % 4096 == 0:
+            progress(i / len(games))
+        t1_obj = teams_by_id.get(t1)
+        t2_obj = teams_by_id.get(t2)
+        if t1_obj and t2_obj:
+            update_team_stats(t1_obj, t2_obj, s1, s2, is_new_game=True)
+
+def generate_schedule(teams, pools, games_per_team, allow_replays=False, score_model=None, seed=None, progress=None):
+    """Build pool-play games for every pooled team and replay them into the team stats.
+
+    Games are scored 0-0 unless a score_model is given, in which case all of
+    them are scored in one batch from a ScoreStream seeded with seed.
+    Returns the new GameTable, or None when there are not enough unique
+    pairings and replays are not allowed. progress, if given, is called
+    with the fraction of teams scheduled so far.
+    """
+    reset_stats(teams)
+    games = GameTable()
+
+    all_teams_in_pools = [t for t in teams if t.pool_id]
+
+    teams_per_pool = {pool_num: pools.count(pool_num) for pool_num in pools.pool_ids()}
+    total_games_needed = len(all_teams_in_pools) * games_per_team / 2
+    total_possible_unique_games = sum(n * (n - 1) / 2 for n in teams_per_pool.values())
+
+    if total_games_needed > total_possible_unique_games and not allow_replays:
+        return None
+
+    played_pairs = set()
+
+    for i, team1 in enumerate(all_teams_in_pools):
+        if progress and i % 256 == 0:
+            progress(i / len(all_teams_in_pools))
+        if team1.games_played >= games_per_team:
+            continue
+
+        eligible_opponents = [t for t in pools.members(team1.pool_id) if t is not team1 and t.games_played < games_per_team]
+        random.shuffle(eligible_opponents)
+
+        for team2 in eligible_opponents:
+            pair = (team1.id, team2.id) if team1.id < team2.id else (team2.id, team1.id)
+            if pair not in played_pairs and team1.games_played < games_per_team and team2.games_played < games_per_team:
+                games.append(team1.id, 0, team2.id, 0)
+                played_pairs.add(pair)
+                team1.games_played += 1
+                team2.games_played += 1
+
+    if allow_replays:
+        for team1 in all_teams_in_pools:
+            while team1.games_played < games_per_team:
+                eligible_opponents = [t for t in pools.members(team1.pool_id) if t is not team1 and t.games_played < games_per_team]
+                if not eligible_opponents:
+                    break
+                team2 = random.choice(eligible_opponents)
+                games.append(team1.id, 0, team2.id, 0)
+                team1.games_played += 1
+                team2.games_played += 1
+
+    if score_model is not None and len(games):
+        scores1, scores2 = score_model.sample(games.team1, games.team2, ScoreStream(seed))
+        games.score1, games.score2 = array("i", scores1), array("i", scores2)
+    replay_stats(teams, games)
+    return games
+
+def h2h_winner(t1, t2, games):
+    for g1, s1, g2, s2 in games:
+        if g1 == t1.id and g2 == t2.id:
+            t1_score, t2_score = s1, s2
+        elif g1 == t2.id and g2 == t1.id:
+            t1_score, t2_score = s2, s1
+        else:
+            continue
+        if t1_score > t2_score: return t1
+        elif t2_score > t1_score: return t2
+    return None
+
+def seed_teams(teams, games, progress=None):
+    """Order teams by wins, breaking two-way ties head-to-head and larger ties by run differential."""
+    sorted_teams = sorted(teams, key=lambda t: t.wins, reverse=True)
+    seeded = []
+    i = 0
+    while i < len(sorted_teams):
+        if progress:
+            progress(i / len(sorted_teams))
+        group = [sorted_teams[i]]
+        j = i + 1
+        while j < len(sorted_teams) and sorted_teams[j].wins == sorted_teams[i].wins:
+            group.append(sorted_teams[j])
+            j += 1
+        if len(group) == 2:
+            winner = h2h_winner(group[0], group[1], games)
+            if winner:
+                if winner == group[0]:
+                    seeded.extend(group)
+                else:
+                    seeded.extend([group[1], group[0]])
+                i = j
+                continue
+        group.sort(key=lambda t: (t.run_differential, -t.runs_against, t.runs_for), reverse=True)
+        if len(group) > 1:
+            random.shuffle(group)
+        seeded.extend(group)
+        i = j
+    return seeded
+
+def write_tournament(filename, teams, games, pool_count, pool_size):
+    data = {
+        "teams":[t.to_dict() for t in teams],
+        "games":games.to_dicts({t.id: t for t in teams}),
+        "pool_count":pool_count,
+        "pool_size":pool_size,
+    }
+    with open(filename, "w") as f:
+        json.dump(data, f, indent=4)
+
+def read_tournament(filename):
+    """Return (teams, games, pool_count, pool_size) from a tournament file.
+
+    Raises IOError or json.JSONDecodeError if the file cannot be read.
+    """
+    with open(filename, "r") as f:
+        data = json.load(f)
+    teams = [Team.from_dict(d) for d in data.get("teams",[])]
+    games = GameTable.from_dicts(data.get("games",[]), teams)
+    return teams, games, data.get("pool_count",5), data.get("pool_size",4)
+
+def load_tournament(filename, progress=None, store=None):
+    """Read a tournament file, or the store's selected tournament, and replay its games into the team stats."""
+    if store is not None:
+        teams, games, pool_count, pool_size = store.read()
+    else:
+        teams, games, pool_count, pool_size = read_tournament(filename)
+    if progress:
+        progress(0.5)
+    replay_progress = (lambda f: progress(0.5 + f / 2)) if progress else None
+    replay_stats(teams, games, progress=replay_progress)
+    return teams, games, pool_count, pool_size
+
+# ------------------ Swiss Pairing ------------------ #
+REMATCH_PENALTY = 10 ** 6
+
+def swiss_points(team, unplayed=0):
+    """Two points a win, one a tie, and a bye counts as a win. unplayed 0-0 games are not ties."""
+    ties = team.games_played - team.wins - team.losses - unplayed
+    return 2 * (team.wins + team.byes) + ties
+
+def _match_window(order, points, played, window):
+    """Minimum-cost perfect matching of order where partners are at most window - 1 places apart.
+
+    Pairing costs the squared points difference, plus REMATCH_PENALTY for
+    teams that have already played. Positions already taken by an earlier
+    pairing are tracked as a bitmask over the next window places, so each
+    step keeps at most 2 ** (window - 1) states.
+    Returns (cost, [(i, j), ...]) as positions in order.
+    """
+    n = len(order)
+    states = {0: 0}
+    back = []
+    for i in range(n):
+        next_states = {}
+        steps = {}
+        for mask, cost in states.items():
+            if mask & 1:
+                candidates = ((mask >> 1, cost, 0),)
+            else:
+                candidates = []
+                for k in range(1, window):
+                    j = i + k
+                    if j >= n:
+                        break
+                    if not mask >> k & 1:
+                        pair_cost = (points[i] - points[j]) ** 2
+                        if (order[i], order[j]) in played:
+                            pair_cost += REMATCH_PENALTY
+                        candidates.append(((mask | 1 << k) >> 1, cost + pair_cost, k))
+            for new_mask, new_cost, k in candidates:
+                if new_cost < next_states.get(new_mask, float('inf')):
+                    next_states[new_mask] = new_cost
+                    steps[new_mask] = (mask, k)
+        states = next_states
+        back.append(steps)
+
+    pairs = []
+    mask = 0
+    for i in range(n - 1, -1, -1):
+        mask, k = back[i][mask]
+        if k:
+            pairs.append((i, i + k))
+    pairs.reverse()
+    return states[0], pairs
+
+def swiss_pairings(teams, games, window=6, max_window=10):
+    """Pair teams with similar records for the next Swiss round, avoiding rematches.
+
+    Teams are ranked by swiss_points() and run differential, and paired by a
+    minimum-cost matching over that ranking (see _match_window). If the best
+    matching still needs a rematch the window is widened, up to max_window.
+    With an odd number of teams the lowest ranked team without a bye sits out.
+    Returns (pairs, bye_team) where pairs is a list of (team1, team2).
+    """
+    played = set()
+    unplayed = {}
+    for t1, s1, t2, s2 in games:
+        played.add((t1, t2))
+        played.add((t2, t1))
+        if is_unplayed(s1, s2):
+            unplayed[t1] = unplayed.get(t1, 0) + 1
+            unplayed[t2] = unplayed.get(t2, 0) + 1
+    points = {t.id: swiss_points(t, unplayed.get(t.id, 0)) for t in teams}
+
+    ranked = teams[:]
+    random.shuffle(ranked)
+    ranked.sort(key=lambda t: (points[t.id], t.run_differential), reverse=True)
+
+    bye_team = None
+    if len(ranked) % 2:
+        bye_team = next((t for t in reversed(ranked) if not t.byes), ranked[-1])
+        ranked.remove(bye_team)
+
+    order = [t.id for t in ranked]
+    scores = [points[t] for t in order]
+    while True:
+        cost, pairs = _match_window(order, scores, played, window)
+        if cost < REMATCH_PENALTY or window >= max_window:
+            break
+        window += 2
+    return [(ranked[i], ranked[j]) for i, j in pairs], bye_team
+
+# ------------------ Clinch Analysis ------------------ #
+def is_unplayed(s1, s2):
+    """Generated games start 0-0, and a game still at 0-0 is treated as not played yet."""
+    return s1 == 0 and s2 == 0
+
+def _assign_wins(games, capacity):
+    """Give the win in as many games as possible to a team with capacity left.
+
+    games is a list of (team_a, team_b) and capacity maps team to the most
+    extra wins it may take. This is a max flow from games to teams, found
+    with breadth-first augmenting paths. Returns the team credited with
+    each game, or None where every path to spare capacity was full.
+    """
+    load = dict.fromkeys(capacity, 0)
+    won = {team: set() for team in capacity}
+    owner = [None] * len(games)
+
+    for game in range(len(games)):
+        # came_by[team] is the game that team would take over on the path
+        came_by = {}
+        queue = []
+        for team in games[game]:
+            if team in capacity and team not in came_by:
+                came_by[team] = game
+                queue.append(team)
+        found = None
+        for team in queue:
+            if load[team] < capacity[team]:
+                found = team
+                break
+            for g in won[team]:
+                a, b = games[g]
+                other = b if a == team else a
+                if other in capacity and other not in came_by:
+                    came_by[other] = g
+                    queue.append(other)
+        if found is None:
+            continue
+        load[found] += 1
+        team = found
+        while True:
+            g = came_by[team]
+            previous = owner[g]
+            owner[g] = team
+            won[team].add(g)
+            if previous is None:
+                break
+            won[previous].discard(g)
+            team = previous
+    return owner
+
+def _split_games(games):
+    """Split games into groups that share no team."""
+    parent = {}
+
+    def find(team):
+        while parent.setdefault(team, team) != team:
+            parent[team] = parent[parent[team]]
+            team = parent[team]
+        return team
+
+    for a, b in games:
+        parent[find(a)] = find(b)
+    parts = {}
+    for game in games:
+        parts.setdefault(find(game[0]), []).append(game)
+    return list(parts.values())
+
+def _fewest_removals(teams, games, blocking_groups):
+    """Fewest of teams to remove before blocking_groups() finds nothing.
+
+    blocking_groups(active) returns disjoint groups of active teams that
+    cannot all be satisfied, each as (excess, relief): excess is by how
+    much, and relief maps each team in the group to the most that removing
+    it cuts the excess. Every group needs its own removals, so their
+    minimums add up to a lower bound that prunes the search, and only teams
+    with relief in the smallest group are branched on. Once removals leave
+    teams that no longer meet, each part is searched on its own.
+    """
+    def solve(active, kept, limit):
+        groups = blocking_groups(active)
+        if not groups:
+            return 0
+        needed = 0
+        for excess, relief in groups:
+            gains = sorted((r for t, r in relief.items() if t not in kept and r > 0), reverse=True)
+            for gain in gains:
+                if excess <= 0:
+                    break
+                excess -= gain
+                needed += 1
+            if excess > 0:
+                return limit
+        if needed >= limit:
+            return limit
+
+        parts = _split_games([(a, b) for a, b in games if a in active and b in active])
+        if len(parts) > 1:
+            total = 0
+            for part in parts:
+                members = frozenset(t for game in part for t in game)
+                total += solve(members, kept & members, limit - total)
+                if total >= limit:
+                    return limit
+            return total
+
+        choices = min((sorted((t for t, r in relief.items() if t not in kept and r > 0),
+                              key=lambda t: relief[t], reverse=True) for _, relief in groups), key=len)
+        best = limit
+        for t in choices:
+            best = min(best, 1 + solve(active - {t}, kept, best - 1))
+            kept = kept | {t}
+        return best
+
+    return solve(frozenset(teams), frozenset(), math.inf)
+
+def _most_reaching(wins, remaining, target):
+    """Most teams that can all finish with at least target wins at the same time.
+
+    Starts from every team that could reach target on its own. A team the
+    flow leaves short belongs to a group that between them get fewer games
+    than they are short, and one of them has to be dropped.
+    """
+    games_of = dict.fromkeys(wins, 0)
+    for a, b in remaining:
+        games_of[a] += 1
+        games_of[b] += 1
+    reached = {t for t, w in wins.items() if w >= target}
+    hopefuls = {t for t in wins if t not in reached and wins[t] + games_of[t] >= target}
+
+    def blocking_groups(active):
+        capacity = {t: target - wins[t] for t in active}
+        pool = [(a, b) for a, b in remaining if a in active or b in active]
+        owner = _assign_wins(pool, capacity)
+        load = dict.fromkeys(capacity, 0)
+        games_of_team = {}
+        for game, (a, b) in enumerate(pool):
+            games_of_team.setdefault(a, []).append(game)
+            games_of_team.setdefault(b, []).append(game)
+            if owner[game] is not None:
+                load[owner[game]] += 1
+
+        groups = []
+        used = set()
+        for short in capacity:
+            if load[short] == capacity[short] or short in used:
+                continue
+            group = set()
+            stack = [short]
+            while stack:
+                team = stack.pop()
+                if team not in group:
+                    group.add(team)
+                    stack.extend(owner[g] for g in games_of_team[team] if owner[g] != team)
+            if group & used:
+                continue
+            used |= group
+            relief = dict((t, capacity[t]) for t in group)
+            touching = 0
+            for a, b in pool:
+                if a in group or b in group:
+                    touching += 1
+                    if a not in group:
+                        relief[b] -= 1
+                    elif b not in group:
+                        relief[a] -= 1
+            groups.append((sum(capacity[t] for t in group) - touching, relief))
+        return groups
+
+    return len(reached) + len(hopefuls) - _fewest_removals(hopefuls, remaining, blocking_groups)
+
+def _first_meetings(games):
+    """First game between each pair of teams that head-to-head can still be decided by.
+
+    Like h2h_winner(), played draws are skipped. Maps (low_id, high_id) to
+    the id of that game's winner, or None if the game is still unplayed.
+    """
+    first = {}
+    for t1, s1, t2, s2 in games:
+        if s1 == s2 and not is_unplayed(s1, s2):
+            continue
+        pair = (t1, t2) if t1 < t2 else (t2, t1)
+        if pair not in first:
+            first[pair] = None if is_unplayed(s1, s2) else (t1 if s1 > s2 else t2)
+    return first
+
+def clinch_analysis(teams, games, progress=None):
+    """Best and worst seed each team can still finish, given the unplayed games.
+
+    Seeds follow seed_teams(): wins decide, a two-way tie goes to the
+    head-to-head winner, and any other tie may go either way since run
+    differential in unplayed games is unknown. An unplayed game may also
+    end in a draw, which gives neither team a win.
+
+    A team's best seed has it win its remaining games and every other game
+    drawn, so only teams already past it finish above. The one exception is
+    a two-way tie lost head-to-head, which a third team reaching the same
+    wins turns back into a tie that can break either way. Its worst seed
+    has as many teams as possible catch up with it while it loses or draws
+    its remaining games, less one if the only team level with it is one it
+    beat head-to-head.
+
+    Returns {team_id: (best_seed, worst_seed)}.
+    """
+    wins = {t.id: t.wins for t in teams}
+    remaining = [(t1, t2) for t1, s1, t2, s2 in games
+                 if is_unplayed(s1, s2) and t1 in wins and t2 in wins]
+    first = _first_meetings(games)
+
+    opponents = {t: {} for t in wins}
+    for a, b in remaining:
+        opponents[a][b] = opponents[a].get(b, 0) + 1
+        opponents[b][a] = opponents[b].get(a, 0) + 1
+    # The most wins each team can finish with
+    potential = {t: wins[t] + sum(opponents[t].values()) for t in wins}
+    sorted_wins = sorted(wins.values())
+    sorted_potential = sorted(potential.values())
+    with_wins = {}
+    with_potential = {}
+    for t in wins:
+        with_wins.setdefault(wins[t], []).append(t)
+        with_potential.setdefault(potential[t], []).append(t)
+
+    def at_least(values, n):
+        return len(values) - bisect.bisect_left(values, n)
+
+    def holds_h2h(winner, loser):
+        pair = (winner, loser) if winner < loser else (loser, winner)
+        return first.get(pair) == winner
+
+    # Groups of teams still to meet each other. A group without the team
+    # being analysed only depends on the target, so its answer is shared.
+    parts = _split_games(remaining)
+    part_of = {}
+    for i, part in enumerate(parts):
+        for game in part:
+            part_of[game[0]] = part_of[game[1]] = i
+    part_wins = [{t: wins[t] for game in part for t in game} for part in parts]
+    idle = {}
+    for team in teams:
+        if team.id not in part_of:
+            idle[team.wins] = idle.get(team.wins, 0) + 1
+
+    most = {}
+
+    def per_part(target):
+        if target not in most:
+            counts = [_most_reaching(part_wins[i], parts[i], target) for i in range(len(parts))]
+            most[target] = (counts, sum(counts))
+        return most[target]
+
+    result = {}
+    for n, team in enumerate(teams):
+        if progress:
+            progress(n / len(teams))
+        me = team.id
+        played_by = opponents[me]
+
+        target = potential[me]
+        above = at_least(sorted_wins, target + 1)
+        best = 1 + above
+        rivals = with_wins.get(target, ())
+        if len(rivals) - (wins[me] == target) == 1 and holds_h2h(next(t for t in rivals if t != me), me):
+            # Every team that could reach target wins without beating this team
+            reaching = at_least(sorted_potential, target) - 1 - (above + 1)
+            for t, count in played_by.items():
+                if wins[t] < target <= potential[t] and potential[t] - count < target:
+                    reaching -= 1
+            if not reaching:
+                best += 1
+
+        target = wins[me]
+        counts, total = per_part(target)
+        i = part_of.get(me)
+        level = sum(c for w, c in idle.items() if w >= target)
+        if i is None:
+            level += total - 1
+        else:
+            beaten_by = {t: w for t, w in part_wins[i].items() if t != me}
+            for t, count in played_by.items():
+                beaten_by[t] += count
+            others = [(a, b) for a, b in parts[i] if me not in (a, b)]
+            level += total - counts[i] + _most_reaching(beaten_by, others, target)
+        worst = 1 + level
+
+        # Drawing its own games instead of losing them leaves opponents where they
+        # are, so every other team may finish on its current wins or anything up
+        # to its potential. Count who is level already and how many more can join.
+        tied = with_wins[target]
+        ahead = at_least(sorted_wins, target) - 1
+        joining = level - ahead
+        if len(tied) == 2 and not joining:
+            y = next(t for t in tied if t != me)
+            if holds_h2h(me, y) and potential[y] == target:
+                worst -= 1
+        elif len(tied) == 1 and joining == 1:
+            # Only one team can get level. If it can't go past and every team that
+            # could be it lost to this one head-to-head, the tie always breaks this way.
+            past = at_least(sorted_potential, target + 1) - (potential[me] > target) - ahead
+            if not past and all(holds_h2h(me, t) for t in with_potential.get(target, ()) if t != me):
+                worst -= 1
+
+        result[me] = (best, worst)
+    return result
+
+# ------------------ SQLite Storage ------------------ #
+DATABASE_EXTENSIONS = (".db", ".sqlite", ".sqlite3")
+FILE_TYPES = [("Tournament files", "*.json *.db *.sqlite *.sqlite3"), ("JSON files", "*.json"), ("SQLite databases", "*.db *.sqlite *.sqlite3")]
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tournaments (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    pool_count INTEGER NOT NULL,
+    pool_size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS teams (
+    id INTEGER PRIMARY KEY,
+    tournament_id INTEGER NOT NULL REFERENCES tournaments(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    pool INTEGER NOT NULL DEFAULT 0,
+    byes INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    tournament_id INTEGER NOT NULL REFERENCES tournaments(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    team1_id INTEGER NOT NULL REFERENCES teams(id),
+    score1 INTEGER NOT NULL,
+    team2_id INTEGER NOT NULL REFERENCES teams(id),
+    score2 INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS teams_by_tournament ON teams(tournament_id, position);
+CREATE INDEX IF NOT EXISTS teams_by_name ON teams(name);
+CREATE UNIQUE INDEX IF NOT EXISTS games_by_tournament ON games(tournament_id, position);
+CREATE INDEX IF NOT EXISTS games_by_team1 ON games(team1_id);
+CREATE INDEX IF NOT EXISTS games_by_team2 ON games(team2_id);
+
+-- One row per team per game, from that team's side
+CREATE VIEW IF NOT EXISTS results AS
+    SELECT tournament_id, team1_id AS team_id, team2_id AS opponent_id, score1 AS runs_for, score2 AS runs_against FROM games
+    UNION ALL
+    SELECT tournament_id, team2_id, team1_id, score2, score1 FROM games;
+
+CREATE VIEW IF NOT EXISTS standings AS
+    SELECT tr.name AS tournament, t.name AS team, t.pool AS pool,
+           COUNT(r.team_id) AS games_played,
+           COALESCE(SUM(r.runs_for > r.runs_against), 0) AS wins,
+           COALESCE(SUM(r.runs_for < r.runs_against), 0) AS losses,
+           COALESCE(SUM(r.runs_for), 0) AS runs_for,
+           COALESCE(SUM(r.runs_against), 0) AS runs_against
+    FROM teams t
+    JOIN tournaments tr ON tr.id = t.tournament_id
+    LEFT JOIN results r ON r.team_id = t.id
+    GROUP BY t.id;
+"""
+
+def is_database(filename):
+    return os.path.splitext(filename)[1].lower() in DATABASE_EXTENSIONS
+
+class SQLiteStore:
+    """A database of tournaments, used in place of JSON files for .db paths.
+
+    open() selects the tournament that read(), save(), save_team() and
+    save_game() work on. save() syncs the whole tournament in one
+    transaction, while save_team() and save_game() rewrite a single row.
+    Team stats are not stored; they are replayed from the games on load,
+    and the standings view computes them in SQL.
+    """
+    def __init__(self, path):
+        self.path = path
+        # The connection is handed to the loader thread and back, never used by both at once
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(SQLITE_SCHEMA)
+        if "byes" not in {column for _, column, *_ in self.conn.execute("PRAGMA table_info(teams)")}:
+            with self.conn:
+                self.conn.execute("ALTER TABLE teams ADD COLUMN byes INTEGER NOT NULL DEFAULT 0")
+        self.name = None
+        self.tournament_id = None
+        self.row_ids = {}
+
+    def close(self):
+        self.conn.close()
+
+    def tournament_names(self):
+        return [name for (name,) in self.conn.execute("SELECT name FROM tournaments ORDER BY id")]
+
+    def open(self, name, pool_count=5, pool_size=4):
+        """Select a tournament to write to, creating it if it does not exist yet."""
+        with self.conn:
+            self.conn.execute("INSERT OR IGNORE INTO tournaments (name, pool_count, pool_size) VALUES (?, ?, ?)",
+                              (name, pool_count, pool_size))
+        (self.tournament_id,) = self.conn.execute("SELECT id FROM tournaments WHERE name = ?", (name,)).fetchone()
+        self.name = name
+        self.row_ids = {}
+
+    def read(self):
+        """Return (teams, games, pool_count, pool_size) for the selected tournament, like read_tournament()."""
+        tournament_id = self.tournament_id
+        pool_count, pool_size = self.conn.execute(
+            "SELECT pool_count, pool_size FROM tournaments WHERE id = ?", (tournament_id,)).fetchone()
+        teams = []
+        teams_by_row = {}
+        for row_id, team_name, pool, byes in self.conn.execute(
+                "SELECT id, name, pool, byes FROM teams WHERE tournament_id = ? ORDER BY position", (tournament_id,)):
+            team = Team(team_name)
+            team.pool_id = pool
+            team.byes = byes
+            teams.append(team)
+            teams_by_row[row_id] = team.id
+        games = GameTable()
+        for t1, s1, t2, s2 in self.conn.execute(
+                "SELECT team1_id, score1, team2_id, score2 FROM games WHERE tournament_id = ? ORDER BY position", (tournament_id,)):
+            games.append(teams_by_row[t1], s1, teams_by_row[t2], s2)
+
+        self.row_ids = {team_id: row_id for row_id, team_id in teams_by_row.items()}
+        return teams, games, pool_count, pool_size
+
+    def save(self, teams, games, pool_count, pool_size):
+        """Write the whole selected tournament in one transaction.
+
+        Games are stored by team row, so games.unresolved is not saved.
+        """
+        with self.conn:
+            tid = self.tournament_id
+            self.conn.execute("UPDATE tournaments SET pool_count = ?, pool_size = ? WHERE id = ?", (pool_count, pool_size, tid))
+            self.conn.execute("DELETE FROM games WHERE tournament_id = ?", (tid,))
+
+            current = {t.id for t in teams}
+            for team_id in [team_id for team_id in self.row_ids if team_id not in current]:
+                del self.row_ids[team_id]
+            kept = set(self.row_ids.values())
+            stale = [(row_id,) for (row_id,) in self.conn.execute("SELECT id FROM teams WHERE tournament_id = ?", (tid,))
+                     if row_id not in kept]
+            self.conn.executemany("DELETE FROM teams WHERE id = ?", stale)
+
+            for position, team in enumerate(teams):
+                row_id = self.row_ids.get(team.id)
+                if row_id is None:
+                    cursor = self.conn.execute("INSERT INTO teams (tournament_id, position, name, pool, byes) VALUES (?, ?, ?, ?, ?)",
+                                               (tid, position, team.name, team.pool_id, team.byes))
+                    self.row_ids[team.id] = cursor.lastrowid
+                else:
+                    self.conn.execute("UPDATE teams SET position = ?, name = ?, pool = ?, byes = ? WHERE id = ?",
+                                      (position, team.name, team.pool_id, team.byes, row_id))
+
+            rows = self.row_ids
+            self.conn.executemany(
+                "INSERT INTO games (tournament_id, position, team1_id, score1, team2_id, score2) VALUES (?, ?, ?, ?, ?, ?)",
+                ((tid, position, rows[t1], s1, rows[t2], s2) for position, (t1, s1, t2, s2) in enumerate(games)))
+
+    def save_team(self, team):
+        row_id = self.row_ids.get(team.id)
+        if row_id is None:
+            return False
+        with self.conn:
+            self.conn.execute("UPDATE teams SET name = ?, pool = ?, byes = ? WHERE id = ?", (team.name, team.pool_id, team.byes, row_id))
+        return True
+
+    def save_game(self, position, game):
+        t1, s1, t2, s2 = game
+        if t1 not in self.row_ids or t2 not in self.row_ids:
+            return False
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO games (tournament_id, position, team1_id, score1, team2_id, score2) VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (tournament_id, position) DO UPDATE SET "
+                "team1_id = excluded.team1_id, score1 = excluded.score1, team2_id = excluded.team2_id, score2 = excluded.score2",
+                (self.tournament_id, position, self.row_ids[t1], s1, self.row_ids[t2], s2))
+        return True
+
+    # Queries across every tournament in the database
+    def standings(self, tournament=None):
+        """(tournament, team, pool, games_played, wins, losses, runs_for, runs_against) rows."""
+        if tournament is None:
+            return self.conn.execute("SELECT * FROM standings ORDER BY tournament, wins DESC").fetchall()
+        return self.conn.execute("SELECT * FROM standings WHERE tournament = ? ORDER BY wins DESC", (tournament,)).fetchall()
+
+    def team_record(self, team_name):
+        """One standings row per tournament the team played in."""
+        return self.conn.execute("SELECT * FROM standings WHERE team = ? ORDER BY tournament", (team_name,)).fetchall()
+
+    def head_to_head(self, team_a, team_b):
+        """(tournament, runs for team_a, runs for team_b) for every game between the two teams."""
+        return self.conn.execute("""
+            SELECT tr.name, r.runs_for, r.runs_against
+            FROM results r
+            JOIN teams a ON a.id = r.team_id
+            JOIN teams b ON b.id = r.opponent_id
+            JOIN tournaments tr ON tr.id = r.tournament_id
+            WHERE a.name = ? AND b.name = ?
+            ORDER BY tr.id""", (team_a, team_b)).fetchall()
+
+def migrate_json_to_sqlite(json_paths, db_path, progress=None):
+    """Copy tournament files into a database, one tournament per file named after the file.
+
+    A tournament already in the database under the same name is replaced.
+    Games naming a team that isn't in the file can't be stored and are skipped.
+    Returns {name: skipped_games} for the migrated tournaments, in file order.
+    """
+    store = SQLiteStore(db_path)
+    skipped = {}
+    try:
+        for i, path in enumerate(json_paths):
+            if progress:
+                progress(i / len(json_paths))
+            teams, games, pool_count, pool_size = read_tournament(path)
+            name = os.path.splitext(os.path.basename(path))[0]
+            store.open(name)
+            store.save(teams, games, pool_count, pool_size)
+            skipped[name] = len(games.unresolved)
+    finally:
+        store.close()
+    return skipped
+
+# ------------------ Background Tasks ------------------ #
+class TaskCancelled(Exception):
+    pass
+
+class Task:
+    """Progress and cancellation shared between a background job and the UI."""
+    def __init__(self, label):
+        self.label = label
+        self.progress = 0.0
+        self._cancelled = threading.Event()
+
+    def report(self, fraction):
+        """Record progress from the job. Raises TaskCancelled once cancel() has been called."""
+        self.progress = fraction
+        if self._cancelled.is_set():
+            raise TaskCancelled()
+
+    def cancel(self):
+        self._cancelled.set()
+
+class TaskRunner:
+    """Runs one job at a time on a worker thread and hands its result back on the Tk thread.
+
+    A job is called with its Task and must only touch the snapshot it was
+    built from. Its result is passed to on_done from the Tk main loop, so the
+    model and widgets are updated in one batch once the job has finished.
+    """
+    POLL_MS = 50
+
+    def __init__(self, root, on_status):
+        self.root = root
+        self.on_status = on_status
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.task = None
+        self._future = None
+        self._callbacks = None
+
+    @property
+    def busy(self):
+        return self.task is not None
+
+    def run(self, label, job, on_done, on_error=None, on_cancelled=None):
+        self.task = Task(label)
+        self._future = self.executor.submit(job, self.task)
+        self._callbacks = (on_done, on_error, on_cancelled)
+        self.on_status(self.task)
+        self.root.after(self.POLL_MS, self._poll)
+
+    def run_now(self, label, job, on_done, on_error=None):
+        """Run a job on the calling thread, for small jobs that other code waits on."""
+        try:
+            result = job(Task(label))
+        except Exception as e:
+            if on_error is None:
+                raise
+            on_error(e)
+            return
+        on_done(result)
+
+    def cancel(self):
+        if self.task:
+            self.task.cancel()
+
+    def _poll(self):
+        task, future = self.task, self._future
+        if not future.done():
+            self.on_status(task)
+            self.root.after(self.POLL_MS, self._poll)
+            return
+
+        on_done, on_error, on_cancelled = self._callbacks
+        self.task = self._future = self._callbacks = None
+        try:
+            result = future.result()
+        except TaskCancelled:
+            self.on_status(None, f"{task.label} cancelled")
+            if on_cancelled is not None:
+                on_cancelled()
+            return
+        except Exception as e:
+            self.on_status(None)
+            if on_error is None:
+                messagebox.showerror("Error", str(e))
+            else:
+                on_error(e)
+            return
+        self.on_status(None)
+        on_done(result)
+
 # ------------------ Tournament GUI ------------------ #
 class TournamentGUI:
+    # Size of one pool on the Pools tab grid, in pixels
+    POOL_SLOT_WIDTH = 220
+    POOL_SLOT_HEIGHT = 200
+
     def __init__(self, root):
         self.root = root
         self.root.title("Tournament Manager")
@@ -49,25 +1257,37 @@ class TournamentGUI:
 
         # Tournament data
         self.teams = []
-        self.games = []
-        self.pools = {}
+        self.teams_by_id = {}
+        self.games = GameTable()
         self.pool_count = 5
+        self.pool_index = PoolIndex(self.pool_count)
         self.pool_size = 4
         self.current_file = None
+        self.store = None
+        self.revision = 0  # bumped on every change, so tasks can tell their snapshot went stale
         self.games_per_team_var = tk.StringVar(value="3")
         self.allow_replays_var = tk.BooleanVar(value=False)
 
         self.pool_container = None
+        self.pool_canvas = None
+        self.pool_slots = []
+        self.pool_columns = 1
+        self.visible_pools = None
         self.pool_frames = {}
         self.pool_listboxes = {}
+        self.listbox_pools = {}
         self.pool_colors = {}
         
         self.bank_listbox = None
 
         self.drag_data = {"item": None, "source_listbox": None}
+        self.game_listbox_rows = []
+
+        self.tasks = TaskRunner(self.root, self.update_status)
 
         self.create_widgets()
-        self.startup_prompt()
+        # Ask once the main loop is running, so the window is drawn first
+        self.root.after_idle(self.startup_prompt)
 
     # ------------------ GUI ------------------ #
     def create_widgets(self):
@@ -79,13 +1299,23 @@ class TournamentGUI:
         file_menu.add_command(label="New Tournament", command=self.startup_prompt)
         file_menu.add_command(label="Load Tournament", command=self.startup_prompt)
         file_menu.add_command(label="Save Tournament", command=self.save_tournament_file)
+        file_menu.add_command(label="Import JSON Files into Database...", command=self.migrate_to_database)
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit)
+        file_menu.add_command(label="Exit", command=self.exit_app)
 
         info_menu = tk.Menu(menubar, tearoff=False)
         menubar.add_cascade(label="Info", menu=info_menu)
         info_menu.add_command(label="Version & License", command=self.show_info)
 
+        status_bar = ttk.Frame(self.root)
+        status_bar.pack(side=tk.BOTTOM, fill="x")
+        self.status_label = ttk.Label(status_bar, text="")
+        self.status_label.pack(side=tk.LEFT, padx=5)
+        self.cancel_button = ttk.Button(status_bar, text="Cancel", command=self.tasks.cancel, state="disabled")
+        self.cancel_button.pack(side=tk.RIGHT, padx=5)
+        self.progress_bar = ttk.Progressbar(status_bar, maximum=1.0, length=200)
+        self.progress_bar.pack(side=tk.RIGHT, padx=5, pady=2)
+
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(fill="both", expand=True)
 
@@ -99,10 +1329,43 @@ class TournamentGUI:
         self.notebook.add(self.tab_games, text="Games")
         self.notebook.add(self.tab_seeding, text="Seeding")
 
-        self.create_team_tab()
-        self.create_pool_tab()
-        self.create_game_tab()
-        self.create_seeding_tab()
+        # Tabs are built the first time they are shown and only refreshed while on screen
+        self.tab_views = {
+            self.tab_teams: (self.create_team_tab, self.update_team_listbox),
+            self.tab_pools: (self.create_pool_tab, self.update_all_pool_listboxes),
+            self.tab_games: (self.create_game_tab, self.update_game_listbox),
+            self.tab_seeding: (self.create_seeding_tab, self.clear_seeding),
+        }
+        self.built_tabs = set()
+        self.stale_tabs = set()
+        self.notebook.bind("<<NotebookTabChanged>>", lambda e: self.show_tab())
+        self.show_tab()
+
+    def current_tab(self):
+        selected = self.notebook.select()
+        return next((tab for tab in self.tab_views if str(tab) == selected), self.tab_teams)
+
+    def show_tab(self, tab=None):
+        """Show tab, the selected one by default, building it on first use and refreshing it if it went stale."""
+        if tab is None:
+            tab = self.current_tab()
+        else:
+            self.notebook.select(tab)
+        build, refresh = self.tab_views[tab]
+        if tab not in self.built_tabs:
+            self.built_tabs.add(tab)
+            build()
+            self.stale_tabs.add(tab)
+        if tab in self.stale_tabs:
+            self.stale_tabs.discard(tab)
+            refresh()
+
+    def view_ready(self, tab):
+        """True if tab is on screen. Otherwise it is marked to refresh when next shown."""
+        if tab in self.built_tabs and self.current_tab() is tab:
+            return True
+        self.stale_tabs.add(tab)
+        return False
 
     def startup_prompt(self):
         if self.current_file and not messagebox.askyesno("Confirm", "You have an open tournament. Do you want to continue without saving?"):
@@ -131,16 +1394,16 @@ class TournamentGUI:
         def handle_new():
             popup.destroy()
             self.new_tournament()
-            self.current_file = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON files","*.json")])
-            if not self.current_file:
+            if not self.choose_save_file():
                 self.root.quit()
+                return
             self._save_to_file()
             self.update_all_views()
 
         def handle_load():
             popup.destroy()
             self.load_tournament_file()
-            if not self.current_file:
+            if not self.current_file and not self.tasks.busy:
                 self.root.quit()
 
         ttk.Label(popup, text="Would you like to start a new tournament or\nload an existing one?", justify=tk.CENTER).pack(pady=10)
@@ -154,29 +1417,119 @@ class TournamentGUI:
         popup.protocol("WM_DELETE_WINDOW", self.root.quit)
         self.root.wait_window(popup)
 
-    def autosave(self):
-        if self.current_file:
-            self._save_to_file()
+    def autosave(self, team=None, game_index=None):
+        """Save after a change. A database saves just the given team or game row when one is passed."""
+        self.revision += 1
+        if not self.current_file:
+            return
+        if self.store and team is not None and self.store.save_team(team):
+            return
+        if self.store and game_index is not None and self.store.save_game(game_index, self.games[game_index]):
+            return
+        self._save_to_file()
 
     def _save_to_file(self):
-        data = {
-            "teams":[t.to_dict() for t in self.teams],
-            "games":self.games,
-            "pool_count":self.pool_count,
-            "pool_size":self.pool_size,
-        }
-        with open(self.current_file, "w") as f:
-            json.dump(data, f, indent=4)
+        if self.store:
+            self.store.save(self.teams, self.games, self.pool_count, self.pool_size)
+        else:
+            write_tournament(self.current_file, self.teams, self.games, self.pool_count, self.pool_size)
+
+    def set_store(self, store):
+        if self.store and self.store is not store:
+            self.store.close()
+        self.store = store
+
+    def choose_save_file(self):
+        """Ask where to save the open tournament. Returns False if the user cancelled."""
+        # A database holds several tournaments, so picking an existing one is not an overwrite
+        filename = filedialog.asksaveasfilename(defaultextension=".json", filetypes=FILE_TYPES, confirmoverwrite=False)
+        if not filename:
+            return False
+        if is_database(filename):
+            unresolved = len(self.games.unresolved)
+            if unresolved and not messagebox.askyesno("Unmatched Games", f"Games naming teams that are not in this tournament: {unresolved}. A database only stores games between its own teams, so these games will be lost. Save to the database anyway?"):
+                return False
+            try:
+                store = SQLiteStore(filename)
+                taken = set(store.tournament_names())
+            except sqlite3.DatabaseError:
+                messagebox.showerror("Error", "Could not read file.")
+                return False
+            while True:
+                name = simpledialog.askstring("Tournament Name", "Name of this tournament in the database:")
+                if not name or not name.strip():
+                    store.close()
+                    return False
+                name = name.strip()
+                if name not in taken:
+                    break
+                # Saving under an existing name would replace that tournament's teams and games
+                messagebox.showerror("Error", f"This database already has a tournament named {name}. Choose another name, or load it instead.")
+            store.open(name, self.pool_count, self.pool_size)
+            self.set_store(store)
+        else:
+            if os.path.exists(filename) and not messagebox.askyesno("Confirm", f"{os.path.basename(filename)} already exists. Do you want to replace it?"):
+                return False
+            self.set_store(None)
+        self.current_file = filename
+        return True
 
     def update_all_views(self):
         self.update_team_listbox()
         self.update_game_listbox()
         self.update_all_pool_listboxes()
-        self.seeding_listbox.delete(0, tk.END)
+        self.clear_seeding()
+
+    def report_ready(self, label, started):
+        """Show in the status bar how long label took, once the pending redraws have run."""
+        self.root.after_idle(lambda: self.update_status(None, f"{label} in {time.perf_counter() - started:.2f} s"))
+
+    def exit_app(self):
+        self.tasks.cancel()
+        self.root.quit()
+
+    # ------------------ Background Tasks ------------------ #
+    def update_status(self, task, message=""):
+        if task:
+            self.status_label.config(text=task.label)
+            self.progress_bar.config(value=task.progress)
+            self.cancel_button.config(state="normal")
+        else:
+            self.status_label.config(text=message)
+            self.progress_bar.config(value=0)
+            self.cancel_button.config(state="disabled")
+
+    def start_task(self, label, job, on_done, on_error=None, background=True, snapshot=False, on_cancelled=None):
+        """Run job in the background. With snapshot, job works on a copy of the tournament and its
+        result is discarded if the tournament changes before it arrives. on_cancelled is called
+        instead of on_done if the user cancels the job."""
+        if snapshot:
+            revision = self.revision
+            apply = on_done
+
+            def on_done(result):
+                if self.revision != revision:
+                    messagebox.showwarning("Tournament Changed", f"{label} was discarded because the tournament changed while it ran. Please run it again.")
+                    return
+                apply(result)
+
+        if not background:
+            self.tasks.run_now(label, job, on_done, on_error)
+            return
+        if self.task_running():
+            return
+        self.tasks.run(label, job, on_done, on_error, on_cancelled)
+
+    def task_running(self):
+        """Tell the user and return True if a background task is still running."""
+        if not self.tasks.busy:
+            return False
+        messagebox.showinfo("Busy", f"{self.tasks.task.label} is still running. Wait for it to finish or cancel it first.")
+        return True
 
     # ------------------ Info Menu ------------------ #
     def show_info(self):
-        version_info = "Version: 1.3"
+        version_info = f"Version: {VERSION}"
         creator_info = "Creator: Ty Thomasson"
         license_info = (
             "License: This software is not to be used for commercial purposes or distributed "
@@ -218,8 +1571,12 @@ class TournamentGUI:
         if any(t.name == name for t in self.teams):
             messagebox.showerror("Error", "Team already exists")
             return
-        self.teams.append(Team(name))
+        team = Team(name)
+        self.teams.append(team)
+        self.teams_by_id[team.id] = team
+        self.pool_index.add(team)
         self.team_entry.delete(0, tk.END)
+        self.resolve_games()
         self.update_team_listbox()
         self.update_all_pool_listboxes()
         self.autosave()
@@ -229,11 +1586,22 @@ class TournamentGUI:
         if not selected: return
         idx = selected[0]
         team_to_remove = self.teams[idx]
-        if team_to_remove.pool:
-            pool_num = int(team_to_remove.pool.split()[1])
-            if pool_num in self.pools and team_to_remove in self.pools[pool_num]:
-                self.pools[pool_num].remove(team_to_remove)
+        self.pool_index.remove(team_to_remove)
+
+        # The removed team's games are kept by name, and come back if a team with that name is added again
+        kept_games = GameTable()
+        kept_games.unresolved = self.games.unresolved
+        for t1, s1, t2, s2 in self.games:
+            if team_to_remove.id in (t1, t2):
+                team1, team2 = self.teams_by_id[t1], self.teams_by_id[t2]
+                remove_game_stats(team1, team2, s1, s2)
+                kept_games.unresolved.append({"team1": team1.name, "score1": s1, "team2": team2.name, "score2": s2})
+            else:
+                kept_games.append(t1, s1, t2, s2)
+        self.games = kept_games
+
         del self.teams[idx]
+        del self.teams_by_id[team_to_remove.id]
         self.update_team_listbox()
         self.update_all_pool_listboxes()
         self.update_game_listbox()
@@ -245,14 +1613,33 @@ class TournamentGUI:
         new_name = simpledialog.askstring("Rename Team", f"Enter new name for {team.name}:")
         if new_name:
             team.name = new_name.strip()
+            resolved = self.resolve_games()
             self.update_team_listbox()
             self.update_all_pool_listboxes()
-            self.autosave()
+            if resolved:
+                self.autosave()
+            else:
+                self.autosave(team=team)
+
+    def resolve_games(self):
+        """Attach saved games that were waiting for a team with a new name. Returns how many."""
+        resolved = self.games.resolve(self.teams)
+        if resolved:
+            replay_stats(self.teams, self.games)
+            self.update_game_listbox()
+            self.clear_seeding()
+        return resolved
+
+    def set_teams(self, teams):
+        self.teams = teams
+        self.teams_by_id = {t.id: t for t in teams}
+        self.pool_index = PoolIndex(self.pool_count, teams)
 
     def update_team_listbox(self):
+        if not self.view_ready(self.tab_teams):
+            return
         self.team_listbox.delete(0, tk.END)
-        for t in self.teams:
-            self.team_listbox.insert(tk.END, t.name)
+        self.team_listbox.insert(tk.END, *(t.name for t in self.teams))
 
     # ------------------ Pools Tab ------------------ #
     def create_pool_tab(self):
@@ -264,42 +1651,93 @@ class TournamentGUI:
         ttk.Button(frame_top, text="Set Pool Settings", command=self.set_pool_settings).pack(side=tk.LEFT, padx=5)
         ttk.Button(frame_top, text="Randomize Remaining", command=self.randomize_remaining).pack(side=tk.LEFT, padx=5)
 
-        self.rebuild_pool_frames()
-        self.update_all_pool_listboxes()
-
-    def rebuild_pool_frames(self):
-        if self.pool_container:
-            self.pool_container.destroy()
-        
         self.pool_container = ttk.Frame(self.tab_pools)
         self.pool_container.pack(fill="both", expand=True, padx=10, pady=10)
 
         bank_frame = ttk.LabelFrame(self.pool_container, text="Bank (Unassigned Teams)")
-        bank_frame.pack(side=tk.LEFT, fill="both", expand=True, padx=5, pady=5)
+        bank_frame.pack(side=tk.LEFT, fill="y", padx=5, pady=5)
         self.bank_listbox = tk.Listbox(bank_frame)
         self.bank_listbox.pack(fill="both", expand=True, padx=5, pady=5)
-        self.bank_listbox.bind("<Button-1>", self.on_drag_start)
-        self.bank_listbox.bind("<B1-Motion>", self.on_drag_motion)
-        self.bank_listbox.bind("<ButtonRelease-1>", self.on_drag_release)
+        self.bind_drag(self.bank_listbox)
 
-        self.pool_frames = {}
-        self.pool_listboxes = {}
-        self.pool_colors = {}
-        
+        # Pools sit on a scrolling canvas and only the pools in view get widgets
+        pool_area = ttk.Frame(self.pool_container)
+        pool_area.pack(side=tk.LEFT, fill="both", expand=True)
+        scrollbar = ttk.Scrollbar(pool_area, orient="vertical")
+        scrollbar.pack(side=tk.RIGHT, fill="y")
+        self.pool_canvas = tk.Canvas(pool_area, highlightthickness=0)
+        self.pool_canvas.pack(side=tk.LEFT, fill="both", expand=True)
+        scrollbar.config(command=self.pool_canvas.yview)
+
+        def on_scroll(first, last):
+            scrollbar.set(first, last)
+            self.show_visible_pools()
+
+        self.pool_canvas.config(yscrollcommand=on_scroll)
+        self.pool_canvas.bind("<Configure>", lambda e: self.layout_pools())
+
+        self.rebuild_pool_frames()
+
+    def bind_drag(self, listbox):
+        listbox.bind("<Button-1>", self.on_drag_start)
+        listbox.bind("<B1-Motion>", self.on_drag_motion)
+        listbox.bind("<ButtonRelease-1>", self.on_drag_release)
+
+    def rebuild_pool_frames(self):
+        """Lay the Pools tab out for the current pool count, reusing the existing pool widgets."""
         hues = [i / self.pool_count for i in range(self.pool_count)]
-        for i, h in enumerate(hues):
-            self.pool_colors[i + 1] = self.hsv_to_hex(h, 0.5, 0.8)
+        self.pool_colors = {i + 1: self.hsv_to_hex(h, 0.5, 0.8) for i, h in enumerate(hues)}
+        if self.pool_canvas is None:
+            return
+        self.pool_canvas.yview_moveto(0)
+        self.layout_pools()
+
+    def layout_pools(self):
+        self.pool_columns = max(1, self.pool_canvas.winfo_width() // self.POOL_SLOT_WIDTH)
+        rows = -(-self.pool_count // self.pool_columns)
+        self.pool_canvas.config(scrollregion=(0, 0, self.pool_columns * self.POOL_SLOT_WIDTH, rows * self.POOL_SLOT_HEIGHT))
+        self.visible_pools = None
+        self.show_visible_pools()
+
+    def show_visible_pools(self):
+        """Give the pools in view a slot, taking slots over from pools scrolled out of view."""
+        rows = -(-self.pool_count // self.pool_columns)
+        top = self.pool_canvas.yview()[0] * rows * self.POOL_SLOT_HEIGHT
+        first_row = int(top) // self.POOL_SLOT_HEIGHT
+        rows_in_view = -(-self.pool_canvas.winfo_height() // self.POOL_SLOT_HEIGHT) + 1
+        visible = range(first_row * self.pool_columns + 1,
+                        min(self.pool_count, (first_row + rows_in_view) * self.pool_columns) + 1)
+        if visible == self.visible_pools:
+            return
+        self.visible_pools = visible
 
-        for i in range(1, self.pool_count + 1):
-            frame = ttk.LabelFrame(self.pool_container, text=f"Pool {i}")
-            frame.pack(side=tk.LEFT, fill="both", expand=True, padx=5, pady=5)
+        while len(self.pool_slots) < len(visible):
+            frame = ttk.LabelFrame(self.pool_canvas)
             lb = tk.Listbox(frame)
             lb.pack(fill="both", expand=True, padx=5, pady=5)
-            self.pool_frames[i] = frame
-            self.pool_listboxes[i] = lb
-            lb.bind("<Button-1>", self.on_drag_start)
-            lb.bind("<B1-Motion>", self.on_drag_motion)
-            lb.bind("<ButtonRelease-1>", self.on_drag_release)
+            self.bind_drag(lb)
+            window = self.pool_canvas.create_window(0, 0, window=frame, anchor="nw",
+                                                    width=self.POOL_SLOT_WIDTH - 10, height=self.POOL_SLOT_HEIGHT - 10)
+            self.pool_slots.append((frame, lb, window))
+
+        fill = self.view_ready(self.tab_pools)
+        self.pool_frames = {}
+        self.pool_listboxes = {}
+        self.listbox_pools = {self.bank_listbox: 0}
+        for i, (frame, lb, window) in enumerate(self.pool_slots):
+            if i >= len(visible):
+                self.pool_canvas.itemconfigure(window, state="hidden")
+                continue
+            pool_num = visible[i]
+            row, column = divmod(pool_num - 1, self.pool_columns)
+            self.pool_canvas.coords(window, column * self.POOL_SLOT_WIDTH + 5, row * self.POOL_SLOT_HEIGHT + 5)
+            self.pool_canvas.itemconfigure(window, state="normal")
+            frame.config(text=f"Pool {pool_num}")
+            self.pool_frames[pool_num] = frame
+            self.pool_listboxes[pool_num] = lb
+            self.listbox_pools[lb] = pool_num
+            if fill:
+                self.fill_pool_listbox(pool_num, lb)
 
     def hsv_to_hex(self, h, s, v):
         r, g, b = colorsys.hsv_to_rgb(h, s, v)
@@ -318,7 +1756,7 @@ class TournamentGUI:
     def on_drag_motion(self, event):
         if self.drag_data["item"]:
             target_listbox = self.root.winfo_containing(event.x_root, event.y_root)
-            if target_listbox in self.pool_listboxes.values() or target_listbox == self.bank_listbox:
+            if target_listbox in self.listbox_pools:
                 if target_listbox != self.drag_data["source_listbox"]:
                     self.drag_data["target_listbox"] = target_listbox
                 else:
@@ -329,105 +1767,67 @@ class TournamentGUI:
     def on_drag_release(self, event):
         if self.drag_data["item"] and "target_listbox" in self.drag_data and self.drag_data["target_listbox"]:
             team_to_move = self.drag_data["item"]
-            source_listbox = self.drag_data["source_listbox"]
             target_listbox = self.drag_data["target_listbox"]
-            target_pool_name = target_listbox.master.cget("text")
 
-            if source_listbox != self.bank_listbox:
-                source_pool_num = int(source_listbox.master.cget("text").split()[1])
-                if team_to_move in self.pools.get(source_pool_num, []):
-                    self.pools[source_pool_num].remove(team_to_move)
-            
-            if target_listbox == self.bank_listbox:
-                team_to_move.pool = ""
-            else:
-                target_pool_num = int(target_pool_name.split()[1])
-                if target_pool_num not in self.pools:
-                    self.pools[target_pool_num] = []
-                self.pools[target_pool_num].append(team_to_move)
-                team_to_move.pool = target_pool_name
+            self.pool_index.move(team_to_move, self.listbox_pools[target_listbox])
 
             self.update_all_pool_listboxes()
             self.update_game_listbox()
-            self.autosave()
+            self.autosave(team=team_to_move)
         
         if self.drag_data.get("source_listbox"):
             self.drag_data["source_listbox"].config(cursor="")
         self.drag_data = {"item": None, "source_listbox": None}
     
     def update_all_pool_listboxes(self):
+        if not self.view_ready(self.tab_pools):
+            return
         self.bank_listbox.delete(0, tk.END)
-        assigned_teams = set()
-        for pool_teams in self.pools.values():
-            assigned_teams.update(pool_teams)
-        
-        unassigned_teams = [t for t in self.teams if t not in assigned_teams]
-        
-        for t in unassigned_teams:
-            self.bank_listbox.insert(tk.END, t.name)
+        self.bank_listbox.insert(tk.END, *(t.name for t in self.pool_index.bank()))
 
         for pool_num, lb in self.pool_listboxes.items():
-            lb.delete(0, tk.END)
-            for t in self.pools.get(pool_num, []):
-                lb.insert(tk.END, f"{t.name} ({t.wins}-{t.losses}, RD:{t.run_differential})")
-                lb.itemconfig(tk.END, {'bg': self.pool_colors.get(pool_num, 'white')})
+            self.fill_pool_listbox(pool_num, lb)
+
+    def fill_pool_listbox(self, pool_num, lb):
+        lb.delete(0, tk.END)
+        for t in self.pool_index.members(pool_num):
+            lb.insert(tk.END, f"{t.name} ({t.wins}-{t.losses}, RD:{t.run_differential})")
+            lb.itemconfig(tk.END, {'bg': self.pool_colors.get(pool_num, 'white')})
 
     def random_pools(self):
         self.clear_pools()
         shuffled = self.teams[:]
         random.shuffle(shuffled)
         
-        pool_keys = sorted(list(self.pool_listboxes.keys()))
+        pool_keys = self.pool_index.pool_ids()
         for i, team in enumerate(shuffled):
-            pool_num = pool_keys[i % len(pool_keys)]
-            if pool_num not in self.pools:
-                self.pools[pool_num] = []
-            self.pools[pool_num].append(team)
-            team.pool = f"Pool {pool_num}"
+            self.pool_index.move(team, pool_keys[i % len(pool_keys)])
 
-        self.games.clear()
-        for team in self.teams:
-            team.wins = 0
-            team.losses = 0
-            team.runs_for = 0
-            team.runs_against = 0
-            team.run_differential = 0
-            team.games_played = 0
+        self.replace_games(GameTable())
 
         self.update_all_pool_listboxes()
         self.update_game_listbox()
         self.autosave()
 
     def randomize_remaining(self):
-        unassigned_teams = [t for t in self.teams if not t.pool]
+        unassigned_teams = list(self.pool_index.bank())
         random.shuffle(unassigned_teams)
-        
-        all_pools = [p for p in self.pool_listboxes.keys()]
-        
+
+        pool_sizes = [(self.pool_index.count(pool_num), pool_num) for pool_num in self.pool_index.pool_ids()]
+        heapq.heapify(pool_sizes)
+
         for team in unassigned_teams:
-            current_pool_sizes = {pool_num: len(self.pools.get(pool_num, [])) for pool_num in all_pools}
-            smallest_pool_num = min(current_pool_sizes, key=current_pool_sizes.get)
-            
-            if smallest_pool_num not in self.pools:
-                self.pools[smallest_pool_num] = []
-            
-            self.pools[smallest_pool_num].append(team)
-            team.pool = f"Pool {smallest_pool_num}"
+            size, smallest_pool_num = heapq.heappop(pool_sizes)
+            self.pool_index.move(team, smallest_pool_num)
+            heapq.heappush(pool_sizes, (size + 1, smallest_pool_num))
 
-        self.games.clear()
-        for team in self.teams:
-            team.wins = 0
-            team.losses = 0
-            team.runs_for = 0
-            team.runs_against = 0
-            team.run_differential = 0
-            team.games_played = 0
+        self.replace_games(GameTable())
 
         self.update_all_pool_listboxes()
         self.update_game_listbox()
         self.autosave()
 
-    def generate_games(self, use_random_scores=False):
+    def generate_games(self, score_model=None, background=True):
         try:
             games_per_team = int(self.games_per_team_var.get())
             if games_per_team < 0:
@@ -436,64 +1836,33 @@ class TournamentGUI:
             messagebox.showerror("Invalid Input", "Games per team must be a non-negative integer.")
             return
 
-        self.games.clear()
-        for team in self.teams:
-            team.wins = 0
-            team.losses = 0
-            team.runs_for = 0
-            team.runs_against = 0
-            team.run_differential = 0
-            team.games_played = 0
-        
-        all_teams_in_pools = [t for t in self.teams if t.pool]
-        
-        teams_per_pool = {pool_num: len(self.pools[pool_num]) for pool_num in self.pools}
-        total_games_needed = len(all_teams_in_pools) * games_per_team / 2
-        total_possible_unique_games = sum(n * (n - 1) / 2 for n in teams_per_pool.values())
-
+        teams = [t.copy() for t in self.teams]
+        pools = PoolIndex(self.pool_count, teams)
         allow_replays = self.allow_replays_var.get()
 
-        if total_games_needed > total_possible_unique_games and not allow_replays:
-             messagebox.showwarning("Warning", "Cannot generate enough unique games. Please check your pool size or allow replays.")
-             return
-
-        played_pairs = set()
-
-        for team1 in all_teams_in_pools:
-            if team1.games_played >= games_per_team:
-                continue
-
-            eligible_opponents = [t for t in all_teams_in_pools if t.name != team1.name and t.pool == team1.pool and t.games_played < games_per_team]
-            random.shuffle(eligible_opponents)
-
-            for team2 in eligible_opponents:
-                pair = tuple(sorted((team1.name, team2.name)))
-                if pair not in played_pairs and team1.games_played < games_per_team and team2.games_played < games_per_team:
-                    score1 = random.randint(0, 10) if use_random_scores else 0
-                    score2 = random.randint(0, 10) if use_random_scores else 0
-                    self.games.append({"team1": team1.name, "score1": score1, "team2": team2.name, "score2": score2})
-                    played_pairs.add(pair)
-                    self.update_team_stats(team1, team2, score1, score2, is_new_game=True)
+        def job(task):
+            return generate_schedule(teams, pools, games_per_team, allow_replays, score_model, progress=task.report)
 
+        def apply(games):
+            if games is None:
+                messagebox.showwarning("Warning", "Cannot generate enough unique games. Please check your pool size or allow replays.")
+                return
+            self.replace_games(games)
+            self.update_game_listbox()
+            self.update_all_pool_listboxes()
+            self.autosave()
 
-        if allow_replays:
-            for team1 in all_teams_in_pools:
-                while team1.games_played < games_per_team:
-                    eligible_opponents = [t for t in all_teams_in_pools if t.name != team1.name and t.pool == team1.pool and t.games_played < games_per_team]
-                    if not eligible_opponents:
-                        break
-                    team2 = random.choice(eligible_opponents)
-                    score1 = random.randint(0, 10) if use_random_scores else 0
-                    score2 = random.randint(0, 10) if use_random_scores else 0
-                    self.games.append({"team1": team1.name, "score1": score1, "team2": team2.name, "score2": score2})
-                    self.update_team_stats(team1, team2, score1, score2, is_new_game=True)
+        self.start_task("Generating games", job, apply, background=background, snapshot=True)
 
-        self.update_game_listbox()
-        self.autosave()
+    def replace_games(self, games):
+        """Swap in a new set of games, replaying the stats. Byes from earlier Swiss rounds go with the old games."""
+        self.games = games
+        replay_stats(self.teams, self.games)
+        for team in self.teams:
+            team.byes = 0
 
     def clear_pools(self):
-        for t in self.teams: t.pool = ""
-        self.pools = {}
+        self.pool_index.clear()
         self.update_all_pool_listboxes()
         self.update_game_listbox()
         self.autosave()
@@ -517,6 +1886,7 @@ class TournamentGUI:
                     messagebox.showerror("Error", "Number of pools must be a positive integer.")
                     return
                 self.pool_count = new_pool_count
+                self.pool_index.resize(new_pool_count)
                 self.rebuild_pool_frames()
                 self.clear_pools()
                 popup.destroy()
@@ -539,14 +1909,50 @@ class TournamentGUI:
         replay_check = ttk.Checkbutton(frame_top, text="Allow Replays", variable=self.allow_replays_var)
         replay_check.pack(side=tk.LEFT, padx=5)
 
-        ttk.Button(frame_top, text="Generate Games", command=lambda: self.generate_games(use_random_scores=False)).pack(side=tk.LEFT, padx=5)
+        ttk.Button(frame_top, text="Generate Games", command=self.generate_games).pack(side=tk.LEFT, padx=5)
+        ttk.Button(frame_top, text="Swiss Round", command=self.swiss_round).pack(side=tk.LEFT, padx=5)
         ttk.Button(frame_top, text="Add Game", command=self.open_game_popup).pack(side=tk.LEFT, padx=5)
 
         self.game_listbox = tk.Listbox(self.tab_games)
         self.game_listbox.pack(fill="both", expand=True, padx=20, pady=10)
         self.game_listbox.bind("<Double-1>", self.edit_game_popup)
 
-    def open_game_popup(self, game_data=None, game_index=None):
+    def swiss_round(self):
+        if len(self.teams) < 2:
+            messagebox.showerror("Error", "At least two teams are needed for a Swiss round.")
+            return
+        unscored = sum(1 for _, s1, _, s2 in self.games if is_unplayed(s1, s2))
+        if unscored and not messagebox.askyesno("Unscored Games", f"Games still at 0-0: {unscored}. They count as not played yet, so their teams are paired on their other results. Pair the next round anyway?"):
+            return
+        teams = [t.copy() for t in self.teams]
+        games = self.games.copy()
+
+        def job(task):
+            pairs, bye_team = swiss_pairings(teams, games)
+            return [(t1.id, t2.id) for t1, t2 in pairs], bye_team.id if bye_team else None
+
+        def apply(result):
+            pairs, bye_id = result
+            for t1, t2 in pairs:
+                self.games.append(t1, 0, t2, 0)
+                update_team_stats(self.teams_by_id[t1], self.teams_by_id[t2], 0, 0, is_new_game=True)
+            bye_team = self.teams_by_id.get(bye_id)
+            if bye_team:
+                bye_team.byes += 1
+            self.update_game_listbox()
+            self.update_all_pool_listboxes()
+            self.autosave()
+            if bye_team:
+                messagebox.showinfo("Swiss Round", f"{bye_team.name} has a bye this round.")
+
+        self.start_task("Pairing Swiss round", job, apply, snapshot=True)
+
+    def open_game_popup(self, game_index=None):
+        game_data = None
+        if game_index is not None:
+            t1, s1, t2, s2 = self.games[game_index]
+            game_data = {'team1': self.teams_by_id[t1].name, 'score1': s1, 'team2': self.teams_by_id[t2].name, 'score2': s2}
+
         popup = tk.Toplevel(self.root)
         popup.title("Add/Edit Game")
         popup.geometry("300x250")
@@ -599,16 +2005,16 @@ class TournamentGUI:
             is_new_game = game_index is None
 
             if not is_new_game:
-                self.remove_game_stats(self.games[game_index])
-                self.games[game_index] = {'team1': t1, 'score1': s1, 'team2': t2, 'score2': s2}
+                old_t1, old_s1, old_t2, old_s2 = self.games[game_index]
+                remove_game_stats(self.teams_by_id[old_t1], self.teams_by_id[old_t2], old_s1, old_s2)
+                self.games[game_index] = (team1_obj.id, s1, team2_obj.id, s2)
             else:
-                new_game = {'team1': t1, 'score1': s1, 'team2': t2, 'score2': s2}
-                self.games.append(new_game)
+                self.games.append(team1_obj.id, s1, team2_obj.id, s2)
                 
-            self.update_team_stats(team1_obj, team2_obj, s1, s2, is_new_game=is_new_game)
+            update_team_stats(team1_obj, team2_obj, s1, s2, is_new_game=is_new_game)
             self.update_game_listbox()
             self.update_all_pool_listboxes()
-            self.autosave()
+            self.autosave(game_index=len(self.games) - 1 if is_new_game else game_index)
             popup.destroy()
 
         ttk.Button(popup, text="Submit", command=submit_popup).pack(pady=10)
@@ -619,158 +2025,85 @@ class TournamentGUI:
         idx = self.game_listbox.curselection()
         if not idx:
             return
-        
-        listbox_text = self.game_listbox.get(idx[0])
-        game = self.find_game_by_display_text(listbox_text)
-        if game:
-            original_index = self.games.index(game)
-            self.open_game_popup(game_data=game, game_index=original_index)
-        else:
-            messagebox.showerror("Error", "Could not find selected game.")
-
-    def find_game_by_display_text(self, text):
-        parts = text.split(" - ")
-        if len(parts) < 2: return None
-        t1_name = parts[0].split(" [")[0].strip()
-        t2_name = parts[1].split("] ")[1].split(" (")[0].strip()
-        try:
-            s1 = int(parts[0].split("[")[1].split("]")[0])
-            s2 = int(parts[1].split("[")[1].split("]")[0])
-        except (ValueError, IndexError):
-            return None # Handle malformed string
-
-        for game in self.games:
-            if (game['team1'] == t1_name and game['team2'] == t2_name and game['score1'] == s1 and game['score2'] == s2):
-                return game
-            elif (game['team1'] == t2_name and game['team2'] == t1_name and game['score1'] == s2 and game['score2'] == s1):
-                return game
-        return None
-
-    def remove_game_stats(self, game):
-        t1_name = game['team1']
-        t2_name = game['team2']
-        t1_obj = next((t for t in self.teams if t.name == t1_name), None)
-        t2_obj = next((t for t in self.teams if t.name == t2_name), None)
-
-        if not t1_obj or not t2_obj:
-            return
-
-        s1, s2 = game['score1'], game['score2']
+        self.open_game_popup(game_index=self.game_listbox_rows[idx[0]])
 
-        t1_obj.runs_for -= s1
-        t1_obj.runs_against -= s2
-        t2_obj.runs_for -= s2
-        t2_obj.runs_against -= s1
-        
-        t1_obj.games_played -= 1
-        t2_obj.games_played -= 1
-
-        if s1 > s2:
-            t1_obj.wins -= 1
-            t2_obj.losses -= 1
-        elif s2 > s1:
-            t2_obj.wins -= 1
-            t1_obj.losses -= 1
-        
-        t1_obj.run_differential = t1_obj.runs_for - t1_obj.runs_against
-        t2_obj.run_differential = t2_obj.runs_for - t2_obj.runs_against
-
-    def update_team_stats(self, team1, team2, s1, s2, is_new_game=True):
-        if is_new_game:
-            team1.games_played += 1
-            team2.games_played += 1
-        
-        team1.runs_for += s1
-        team1.runs_against += s2
-        team2.runs_for += s2
-        team2.runs_against += s1
-        
-        if s1 > s2:
-            team1.wins += 1
-            team2.losses += 1
-        elif s2 > s1:
-            team2.wins += 1
-            team1.losses += 1
-            
-        team1.run_differential = team1.runs_for - team1.runs_against
-        team2.run_differential = team2.runs_for - team2.runs_against
-    
-    def get_pool_sort_key(self, game):
-        t1 = next((t for t in self.teams if t.name == game['team1']), None)
-        if t1 and t1.pool:
-            try:
-                return int(t1.pool.split()[1])
-            except (ValueError, IndexError):
-                return float('inf')
+    def get_pool_sort_key(self, game_index):
+        t1 = self.teams_by_id.get(self.games.team1[game_index])
+        if t1 and t1.pool_id:
+            return t1.pool_id
         return float('inf')
 
     def update_game_listbox(self):
+        if not self.view_ready(self.tab_games):
+            return
         self.game_listbox.delete(0, tk.END)
-        
-        sorted_games = sorted(self.games, key=self.get_pool_sort_key)
+        self.game_listbox_rows = []
 
-        for g in sorted_games:
-            t1_obj = next((t for t in self.teams if t.name == g['team1']), None)
-            t2_obj = next((t for t in self.teams if t.name == g['team2']), None)
+        sorted_rows = sorted(range(len(self.games)), key=self.get_pool_sort_key)
+
+        for row in sorted_rows:
+            t1, s1, t2, s2 = self.games[row]
+            t1_obj = self.teams_by_id.get(t1)
+            t2_obj = self.teams_by_id.get(t2)
 
             if not t1_obj or not t2_obj:
                 continue
 
-            pool_color = 'white'
-            if t1_obj.pool and "Pool" in t1_obj.pool:
-                try:
-                    pool_num = int(t1_obj.pool.split()[1])
-                    pool_color = self.pool_colors.get(pool_num, 'white')
-                except (ValueError, IndexError):
-                    pass
-            
-            display_text = f"{t1_obj.name} [{g['score1']}] - [{g['score2']}] {t2_obj.name} ({t1_obj.pool})"
+            pool_color = self.pool_colors.get(t1_obj.pool_id, 'white')
+            display_text = f"{t1_obj.name} [{s1}] - [{s2}] {t2_obj.name} ({t1_obj.pool})"
             self.game_listbox.insert(tk.END, display_text)
             self.game_listbox.itemconfig(tk.END, {'bg': pool_color})
+            self.game_listbox_rows.append(row)
     
     # ------------------ Seeding Tab ------------------ #
     def create_seeding_tab(self):
-        ttk.Button(self.tab_seeding, text="Calculate Seeding", command=self.calculate_seeding).pack(pady=10)
+        frame_top = ttk.Frame(self.tab_seeding)
+        frame_top.pack(pady=10)
+        ttk.Button(frame_top, text="Calculate Seeding", command=self.calculate_seeding).pack(side=tk.LEFT, padx=5)
+        ttk.Button(frame_top, text="Clinch Analysis", command=self.clinch_seeds).pack(side=tk.LEFT, padx=5)
         self.seeding_listbox = tk.Listbox(self.tab_seeding)
         self.seeding_listbox.pack(fill="both", expand=True, padx=20, pady=10)
         self.seeding_listbox.bind("<Double-1>", self.show_team_history)
 
     def calculate_seeding(self):
-        sorted_teams = sorted(self.teams, key=lambda t: t.wins, reverse=True)
-        seeded = []
-        i = 0
-        while i < len(sorted_teams):
-            group = [sorted_teams[i]]
-            j = i + 1
-            while j < len(sorted_teams) and sorted_teams[j].wins == sorted_teams[i].wins:
-                group.append(sorted_teams[j])
-                j += 1
-            if len(group) == 2:
-                h2h_winner = self.h2h_winner(group[0], group[1])
-                if h2h_winner:
-                    if h2h_winner == group[0]:
-                        seeded.extend(group)
-                    else:
-                        seeded.extend([group[1], group[0]])
-                    i = j
-                    continue
-            group.sort(key=lambda t: (t.run_differential, -t.runs_against, t.runs_for), reverse=True)
-            if len(group) > 1:
-                random.shuffle(group)
-            seeded.extend(group)
-            i = j
-        self.seeding_listbox.delete(0, tk.END)
-        for idx, t in enumerate(seeded):
-            self.seeding_listbox.insert(tk.END, f"Seed {idx+1}: {t.name} ({t.wins}-{t.losses}, RD: {t.run_differential})")
-
-    def h2h_winner(self, t1, t2):
-        for g in self.games:
-            if (g["team1"] == t1.name and g["team2"] == t2.name) or (g["team1"] == t2.name and g["team2"] == t1.name):
-                t1_score = g["score1"] if g["team1"] == t1.name else g["score2"]
-                t2_score = g["score2"] if g["team1"] == t1.name else g["score1"]
-                if t1_score > t2_score: return t1
-                elif t2_score > t1_score: return t2
-        return None
+        teams = [t.copy() for t in self.teams]
+        games = self.games.copy()
+
+        def job(task):
+            return seed_teams(teams, games, progress=task.report)
+
+        def apply(seeded):
+            self.seeding_listbox.delete(0, tk.END)
+            for idx, t in enumerate(seeded):
+                self.seeding_listbox.insert(tk.END, f"Seed {idx+1}: {t.name} ({t.wins}-{t.losses}, RD: {t.run_differential})")
+
+        self.start_task("Calculating seeding", job, apply, snapshot=True)
+
+    def clear_seeding(self):
+        if self.view_ready(self.tab_seeding):
+            self.seeding_listbox.delete(0, tk.END)
+
+    def clinch_seeds(self):
+        """List the range of seeds each team can still finish in, treating 0-0 games as unplayed."""
+        teams = [t.copy() for t in self.teams]
+        games = self.games.copy()
+
+        def job(task):
+            return clinch_analysis(teams, games, progress=task.report)
+
+        def apply(ranges):
+            left = dict.fromkeys(ranges, 0)
+            for t1, s1, t2, s2 in games:
+                if is_unplayed(s1, s2) and t1 in left and t2 in left:
+                    left[t1] += 1
+                    left[t2] += 1
+            self.seeding_listbox.delete(0, tk.END)
+            for t in sorted(teams, key=lambda t: ranges[t.id]):
+                best, worst = ranges[t.id]
+                seeds = f"Seed {best}" if best == worst else f"Seeds {best}-{worst}"
+                self.seeding_listbox.insert(tk.END, f"{seeds}: {t.name} ({t.wins}-{t.losses}, {left[t.id]} left)")
+
+        self.start_task("Analysing remaining games", job, apply, snapshot=True)
 
     def show_team_history(self, event):
         idx = self.seeding_listbox.curselection()
@@ -782,80 +2115,129 @@ class TournamentGUI:
         if not team:
             return
         history = ""
-        for g in self.games:
-            if g['team1'] == team.name or g['team2'] == team.name:
-                other = g['team2'] if g['team1'] == team.name else g['team1']
-                score_self = g['score1'] if g['team1'] == team.name else g['score2']
-                score_other = g['score2'] if g['team1'] == team.name else g['score1']
+        for t1, s1, t2, s2 in self.games:
+            if team.id in (t1, t2):
+                other = self.teams_by_id.get(t2 if t1 == team.id else t1)
+                if not other:
+                    continue
+                score_self = s1 if t1 == team.id else s2
+                score_other = s2 if t1 == team.id else s1
                 result = "W" if score_self > score_other else "L" if score_self < score_other else "T"
-                pool = next((t.pool for t in self.teams if t.name == other), "")
-                history += f"{team.name} [{score_self}] - [{score_other}] {other} ({pool}) -> {result}\n"
+                history += f"{team.name} [{score_self}] - [{score_other}] {other.name} ({other.pool}) -> {result}\n"
         messagebox.showinfo(f"{team.name} History", history if history else "No games played")
 
     # ------------------ Tournament Files ------------------ #
     def new_tournament(self):
-        self.teams = []
-        self.games = []
-        self.clear_pools()
         self.current_file = None
+        self.set_store(None)
+        self.set_teams([])
+        self.games = GameTable()
+        self.clear_pools()
         self.update_all_views()
 
     def save_tournament_file(self):
         if not self.current_file:
-            self.current_file = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON files","*.json")])
-            if not self.current_file: return
+            if not self.choose_save_file(): return
         self._save_to_file()
         messagebox.showinfo("Saved", f"Tournament saved to {self.current_file}")
 
     def load_tournament_file(self):
-        filename = filedialog.askopenfilename(filetypes=[("JSON files","*.json")])
+        # Checked before a database is opened, so a busy runner can't leave it open
+        if self.task_running():
+            return
+        filename = filedialog.askopenfilename(filetypes=FILE_TYPES)
         if not filename:
             return
-        try:
-            with open(filename, "r") as f:
-                data = json.load(f)
-                self.teams = [Team.from_dict(d) for d in data.get("teams",[])]
-                self.games = data.get("games",[])
-                self.pool_count = data.get("pool_count",5)
-                self.pool_size = data.get("pool_size",4)
-        except (IOError, json.JSONDecodeError):
-            messagebox.showerror("Error", "Could not read file.")
+
+        def failed(error):
+            if store:
+                store.close()
+            if isinstance(error, (IOError, json.JSONDecodeError, sqlite3.DatabaseError)):
+                messagebox.showerror("Error", "Could not read file.")
+            else:
+                messagebox.showerror("Error", str(error))
+            # Nothing to fall back to, same as cancelling the startup prompt
+            if not self.current_file:
+                self.root.quit()
+
+        def cancelled():
+            if store:
+                store.close()
+            # Without an open file nothing would be saved, so ask again
+            if not self.current_file:
+                self.startup_prompt()
+
+        store = None
+        if is_database(filename):
+            try:
+                store = SQLiteStore(filename)
+                name = self.choose_tournament(store)
+            except sqlite3.DatabaseError as e:
+                failed(e)
+                return
+            if not name:
+                store.close()
+                return
+            store.open(name)
+
+        started = time.perf_counter()
+
+        def job(task):
+            return load_tournament(filename, progress=task.report, store=store)
+
+        def apply(loaded):
+            self._apply_loaded(filename, loaded, store)
+            self.report_ready(f"Loaded {len(self.teams)} teams", started)
+            messagebox.showinfo("Loaded", f"Tournament loaded from {filename}")
+
+        self.start_task("Loading tournament", job, apply, failed, on_cancelled=cancelled)
+
+    def choose_tournament(self, store):
+        """Ask which tournament in a database to open. Returns None if there is nothing to open."""
+        names = store.tournament_names()
+        if not names:
+            messagebox.showerror("Error", "There are no tournaments in this database.")
+            return None
+        if len(names) == 1:
+            return names[0]
+        name = simpledialog.askstring("Choose Tournament", "Tournaments in this database:\n\n" + "\n".join(names) + "\n\nName of the tournament to open:", initialvalue=names[-1])
+        if name and name not in names:
+            messagebox.showerror("Error", f"There is no tournament named {name}.")
+            return None
+        return name
+
+    def migrate_to_database(self):
+        json_paths = filedialog.askopenfilenames(title="Tournament files to import", filetypes=[("JSON files","*.json")])
+        if not json_paths:
+            return
+        db_path = filedialog.asksaveasfilename(title="Database to import into", defaultextension=".db", confirmoverwrite=False,
+                                               filetypes=[("SQLite databases", "*.db *.sqlite *.sqlite3")])
+        if not db_path:
             return
 
+        def job(task):
+            return migrate_json_to_sqlite(list(json_paths), db_path, progress=task.report)
+
+        def apply(skipped):
+            message = f"Imported {len(skipped)} tournaments into {db_path}"
+            lost = {name: count for name, count in skipped.items() if count}
+            if lost:
+                message += "\n\nGames skipped because they name teams missing from the file:\n" + "\n".join(f"{name}: {count}" for name, count in lost.items())
+            messagebox.showinfo("Imported", message)
+
+        self.start_task("Importing tournaments", job, apply)
+
+    def _load_from_file(self, filename):
+        self._apply_loaded(filename, load_tournament(filename))
+
+    def _apply_loaded(self, filename, loaded, store=None):
+        teams, self.games, self.pool_count, self.pool_size = loaded
+        self.revision += 1
+        self.set_store(store)
+        self.set_teams(teams)
         self.current_file = filename
         self.rebuild_pool_frames()
-        self.restore_pools_from_teams()
-        
-        for team in self.teams:
-            team.wins = 0
-            team.losses = 0
-            team.runs_for = 0
-            team.runs_against = 0
-            team.run_differential = 0
-            team.games_played = 0
-        
-        for g in self.games:
-            t1_obj = next((t for t in self.teams if t.name == g['team1']), None)
-            t2_obj = next((t for t in self.teams if t.name == g['team2']), None)
-            if t1_obj and t2_obj:
-                self.update_team_stats(t1_obj, t2_obj, g['score1'], g['score2'], is_new_game=True)
-
         self.update_all_views()
-        messagebox.showinfo("Loaded", f"Tournament loaded from {filename}")
-
-    def restore_pools_from_teams(self):
-        self.pools = {}
-        for t in self.teams:
-            if t.pool and "Pool" in t.pool:
-                try:
-                    pool_num = int(t.pool.split()[1])
-                    if pool_num not in self.pools:
-                        self.pools[pool_num] = []
-                    self.pools[pool_num].append(t)
-                except (ValueError, IndexError):
-                    t.pool = ""
-                    continue
-        self.update_all_pool_listboxes()
 
     # ------------------ Demo / Defaults ------------------ #
     def load_demo(self):
@@ -863,14 +2245,14 @@ class TournamentGUI:
             messagebox.showerror("Error", "Please create or load a tournament first.")
             return
 
-        self.teams.clear()
-        for i in range(1, 21):
-            self.teams.append(Team(f"Team {i}"))
         self.pool_count = 5
         self.pool_size = 4
+        self.set_teams([Team(f"Team {i}") for i in range(1, 21)])
+        self.games = GameTable()
         self.rebuild_pool_frames()
         self.random_pools()
-        self.generate_games(use_random_scores=True)
+        strengths = {t.id: random.uniform(0.6, 1.6) for t in self.teams}
+        self.generate_games(score_model=PoissonScoreModel(strengths), background=False)
         self.update_all_views()
         self.autosave()
 